@@ -38,6 +38,7 @@ class MonitoringConfig(BaseModel):
     enabled: bool = True
     interval: int = 30  # seconds
     metrics: List[str] = Field(default=["cpu", "memory", "disk", "network"])
+    slow_interval_ticks: int = 1  # Refresh process and connection counts every N intervals
     
     @validator("interval")
     def validate_interval(cls, v):
@@ -45,6 +46,12 @@ class MonitoringConfig(BaseModel):
             raise ValueError(f"Monitoring interval must be at least 1 second, got {v}")
         return v
     
+    @validator("slow_interval_ticks")
+    def validate_slow_interval_ticks(cls, v):
+        if v < 1:
+            raise ValueError(f"Slow interval ticks must be at least 1, got {v}")
+        return v
+    
     @validator("metrics")
     def validate_metrics(cls, v):
         valid_metrics = ["cpu", "memory", "disk", "network", "process"]
@@ -133,6 +140,7 @@ class LogsConfig(BaseModel):
     
     paths: Dict[str, str] = Field(default_factory=dict)
     max_entries: int = 1000  # Maximum number of log entries to return
+    follow_journal: bool = False  # Follow the journal in the background to serve recent queries
     
     @validator("max_entries")
     def validate_max_entries(cls, v):
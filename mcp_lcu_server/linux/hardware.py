@@ -12,6 +12,8 @@
 import os
 import re
 import logging
+import platform
+import functools
 import subprocess
 from typing import Dict, List, Optional, Union, Any
 
@@ -19,13 +21,81 @@ import psutil
 
 logger = logging.getLogger(__name__)
 
+# Cached uname(2) result, shared by hostname and kernel lookups
+_UNAME = platform.uname()
+
+# Mapping of /etc/os-release keys to OS info fields
+_OS_RELEASE_FIELDS = {
+    "NAME": "name",
+    "VERSION": "version",
+    "ID": "id",
+    "PRETTY_NAME": "pretty_name",
+}
+
+# Zero-padded two digit strings for formatting uptime
+_PAD2 = tuple(f"{i:02d}" for i in range(100))
+
+
+@functools.lru_cache(maxsize=1024)
+def _bytes_to_human(bytes_value: int) -> str:
+    """Convert bytes to human readable format.
+    
+    Args:
+        bytes_value: Bytes value
+    
+    Returns:
+        Human readable string
+    """
+    for unit in ["B", "KB", "MB", "GB", "TB", "PB"]:
+        if bytes_value < 1024.0:
+            return f"{bytes_value:.2f} {unit}"
+        bytes_value /= 1024.0
+    return f"{bytes_value:.2f} EB"
+
 
 class HardwareOperations:
     """Class for hardware operations on Linux systems."""
     
+    _instance: Optional["HardwareOperations"] = None
+    
     def __init__(self):
         """Initialize hardware operations."""
-        pass
+        # Static system information, computed once per process
+        self._hostname = self._get_hostname()
+        self._kernel = self._get_kernel_version()
+        self._os_info = self._get_os_info()
+        
+        # Persistent descriptor for uptime polling; procfs regenerates
+        # the content on every read, so pread at offset 0 is enough
+        try:
+            self._uptime_fd: Optional[int] = os.open("/proc/uptime", os.O_RDONLY)
+        except OSError:
+            self._uptime_fd = None
+    
+    def __del__(self):
+        """Release resources held by hardware operations."""
+        self.close()
+    
+    def close(self) -> None:
+        """Close the persistent /proc/uptime descriptor."""
+        fd = getattr(self, "_uptime_fd", None)
+        if fd is not None:
+            self._uptime_fd = None
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+    
+    @classmethod
+    def get(cls) -> "HardwareOperations":
+        """Get the shared hardware operations instance.
+        
+        Returns:
+            Module-wide hardware operations instance
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
     
     def get_system_info(self) -> Dict[str, Any]:
         """Get general system information.
@@ -42,9 +112,9 @@ class HardwareOperations:
             
             # Get system information using various commands
             system_info = {
-                "hostname": self._get_hostname(),
-                "kernel": self._get_kernel_version(),
-                "os": self._get_os_info(),
+                "hostname": self._hostname,
+                "kernel": self._kernel,
+                "os": dict(self._os_info),
                 "uptime": self._get_uptime(),
                 "cpu": cpu_info,
                 "memory": memory_info,
@@ -674,17 +744,7 @@ class HardwareOperations:
         Returns:
             Hostname
         """
-        try:
-            return os.uname().nodename
-        except Exception:
-            try:
-                with open("/etc/hostname", "r") as f:
-                    return f.read().strip()
-            except Exception:
-                try:
-                    return subprocess.check_output(["hostname"], universal_newlines=True).strip()
-                except Exception:
-                    return "unknown"
+        return _UNAME.node or "unknown"
     
     def _get_kernel_version(self) -> str:
         """Get kernel version.
@@ -692,13 +752,7 @@ class HardwareOperations:
         Returns:
             Kernel version
         """
-        try:
-            return os.uname().release
-        except Exception:
-            try:
-                return subprocess.check_output(["uname", "-r"], universal_newlines=True).strip()
-            except Exception:
-                return "unknown"
+        return _UNAME.release or "unknown"
     
     def _get_os_info(self) -> Dict[str, str]:
         """Get OS information.
@@ -706,45 +760,33 @@ class HardwareOperations:
         Returns:
             Dictionary with OS information
         """
+        # Initialize OS info
+        os_info = {
+            "name": "Linux",
+            "version": "",
+            "id": "",
+            "pretty_name": ""
+        }
+        
+        # Try to get OS information from /etc/os-release
         try:
-            # Initialize OS info
-            os_info = {
-                "name": "Linux",
-                "version": "",
-                "id": "",
-                "pretty_name": ""
-            }
-            
-            # Try to get OS information from /etc/os-release
-            if os.path.exists("/etc/os-release"):
-                with open("/etc/os-release", "r") as f:
-                    for line in f:
-                        if "=" in line:
-                            key, value = line.strip().split("=", 1)
-                            # Remove quotes
-                            value = value.strip('"\'')
-                            
-                            if key == "NAME":
-                                os_info["name"] = value
-                            elif key == "VERSION":
-                                os_info["version"] = value
-                            elif key == "ID":
-                                os_info["id"] = value
-                            elif key == "PRETTY_NAME":
-                                os_info["pretty_name"] = value
-            
-            # If pretty_name is empty, combine name and version
-            if not os_info["pretty_name"] and os_info["name"]:
-                os_info["pretty_name"] = f"{os_info['name']} {os_info['version']}".strip()
-            
-            return os_info
-        except Exception:
-            return {
-                "name": "Linux",
-                "version": "",
-                "id": "",
-                "pretty_name": "Linux"
-            }
+            with open("/etc/os-release", "r") as f:
+                lines = f.readlines()
+        except (OSError, ValueError):
+            lines = []
+        
+        for line in lines:
+            key, sep, value = line.partition("=")
+            field = _OS_RELEASE_FIELDS.get(key)
+            if sep and field:
+                # Remove newline and quotes
+                os_info[field] = value.rstrip().strip('"\'')
+        
+        # If pretty_name is empty, combine name and version
+        if not os_info["pretty_name"] and os_info["name"]:
+            os_info["pretty_name"] = f"{os_info['name']} {os_info['version']}".strip()
+        
+        return os_info
     
     def _get_uptime(self) -> Dict[str, Any]:
         """Get system uptime.
@@ -752,34 +794,18 @@ class HardwareOperations:
         Returns:
             Dictionary with uptime information
         """
+        # Get uptime in seconds
         try:
-            # Get uptime in seconds
-            with open("/proc/uptime", "r") as f:
-                uptime_seconds = float(f.read().split()[0])
-            
-            # Calculate days, hours, minutes, and seconds
-            days = int(uptime_seconds // (24 * 3600))
-            uptime_seconds %= (24 * 3600)
-            hours = int(uptime_seconds // 3600)
-            uptime_seconds %= 3600
-            minutes = int(uptime_seconds // 60)
-            seconds = int(uptime_seconds % 60)
-            
-            # Format uptime string
-            uptime_string = ""
-            if days > 0:
-                uptime_string += f"{days} day{'s' if days != 1 else ''}, "
-            
-            uptime_string += f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-            
-            return {
-                "seconds": uptime_seconds,
-                "days": days,
-                "hours": hours,
-                "minutes": minutes,
-                "formatted": uptime_string
-            }
-        except Exception:
+            if self._uptime_fd is not None:
+                raw = os.pread(self._uptime_fd, 64, 0)
+            else:
+                fd = os.open("/proc/uptime", os.O_RDONLY)
+                try:
+                    raw = os.read(fd, 64)
+                finally:
+                    os.close(fd)
+            uptime_seconds = float(raw.split(b" ", 1)[0])
+        except (OSError, ValueError):
             return {
                 "seconds": 0,
                 "days": 0,
@@ -787,6 +813,29 @@ class HardwareOperations:
                 "minutes": 0,
                 "formatted": "unknown"
             }
+        
+        # Calculate days, hours, minutes, and seconds
+        days = int(uptime_seconds // (24 * 3600))
+        uptime_seconds %= (24 * 3600)
+        hours = int(uptime_seconds // 3600)
+        uptime_seconds %= 3600
+        minutes = int(uptime_seconds // 60)
+        seconds = int(uptime_seconds % 60)
+        
+        # Format uptime string
+        uptime_string = ""
+        if days > 0:
+            uptime_string += f"{days} day{'s' if days != 1 else ''}, "
+        
+        uptime_string += _PAD2[hours] + ":" + _PAD2[minutes] + ":" + _PAD2[seconds]
+        
+        return {
+            "seconds": uptime_seconds,
+            "days": days,
+            "hours": hours,
+            "minutes": minutes,
+            "formatted": uptime_string
+        }
     
     def _is_command_available(self, command: str) -> bool:
         """Check if a command is available.
@@ -815,8 +864,4 @@ class HardwareOperations:
         Returns:
             Human readable string
         """
-        for unit in ["B", "KB", "MB", "GB", "TB", "PB"]:
-            if bytes_value < 1024.0:
-                return f"{bytes_value:.2f} {unit}"
-            bytes_value /= 1024.0
-        return f"{bytes_value:.2f} EB"
+        return _bytes_to_human(bytes_value)
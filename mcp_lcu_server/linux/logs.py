@@ -11,17 +11,331 @@
 
 import os
 import re
+import errno
 import json
 import time
+import uuid
+import shutil
+import string
+import functools
 import logging
+import threading
 import subprocess
+from bisect import bisect_right
+from fnmatch import fnmatch
+from itertools import accumulate, islice
+from collections import OrderedDict, deque
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Union, Any, Tuple, Callable
+from typing import Dict, List, Optional, Union, Any, Tuple, Callable, Iterable, Iterator, Pattern
 
 from mcp_lcu_server.config import Config
 
+# orjson is optional; its JSONDecodeError subclasses json.JSONDecodeError
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# python-systemd is optional; without it the journal is read through journalctl
+try:
+    from systemd import journal as sd_journal
+    _HAS_SDJOURNAL = True
+except ImportError:
+    sd_journal = None
+    _HAS_SDJOURNAL = False
+
+# pyahocorasick is optional; without it error categories are matched by regex
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for a command stopped early to exit before killing it
+_TERMINATE_TIMEOUT = 5.0
+
+# Lifetime of cached journalctl results in seconds
+_JOURNAL_CACHE_TTL = 10.0
+
+# Lifetime of the cached list of available log sources in seconds
+_AVAILABLE_LOGS_TTL = 30.0
+
+# Maximum number of cached query results
+_CACHE_MAX_ENTRIES = 32
+
+# Journal fields needed by analyze_logs and get_log_statistics
+_ANALYSIS_FIELDS = ("PRIORITY", "MESSAGE", "SYSLOG_TIMESTAMP", "_SYSTEMD_UNIT")
+
+# Log files above this size are searched a whole block at a time
+_BLOCK_SEARCH_THRESHOLD = 16 * 1024 * 1024
+
+# Size of the blocks a large log is searched in, from its end backwards
+_SEARCH_BLOCK = 1024 * 1024
+
+# key=value pairs of an audit record; quoted values may contain spaces
+_AUDIT_KV_RE = re.compile(r'([A-Za-z_][\w\-]*)=("[^"]*"|\S+)')
+
+# Epoch timestamp of an audit record: msg=audit(1714058641.123:456)
+_AUDIT_TS_RE = re.compile(r'msg=audit\((\d+\.\d+):')
+
+# Month abbreviations of syslog timestamps to month numbers
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12
+}
+
+# Current year, month and the monotonic time they are valid until
+_year_month_cache: List[Any] = [0, 0, 0.0]
+
+# Process name and pid in a syslog line: process[pid]:
+_SYSLOG_PROC_RE = re.compile(r'(\S+)\[(\d+)\]:')
+
+# Seconds since boot prefix of a dmesg line: [    0.000000]
+_DMESG_TS_RE = re.compile(r'\[\s*(\d+\.\d+)\]')
+
+# Kernel log device read by dmesg, and the largest record a single read returns
+_KMSG_PATH = "/dev/kmsg"
+_KMSG_RECORD_SIZE = 8192
+
+# Relative time spec suffixes to journalctl time units
+_JOURNAL_TIME_UNITS = {"m": "min", "h": "hours", "d": "days"}
+
+# Unit types; a unit argument without one of them is a service, as for journalctl -u
+_UNIT_TYPES = frozenset((
+    "service", "socket", "target", "device", "mount", "automount",
+    "swap", "timer", "path", "slice", "scope"
+))
+
+# Match terms journalctl -u ORs together for a unit, each a conjunction of
+# (field, value) pairs where a None value stands for the unit name: the unit's
+# own messages, its coredumps, PID 1 messages about it and messages about it
+# from authorized daemons
+_COREDUMP_MESSAGE_ID = "fc2e22bc6ee647b6b90729ab34a250b1"
+_JOURNAL_UNIT_TERMS = (
+    (("_SYSTEMD_UNIT", None),),
+    (("MESSAGE_ID", _COREDUMP_MESSAGE_ID), ("_UID", "0"), ("COREDUMP_UNIT", None)),
+    (("_PID", "1"), ("UNIT", None)),
+    (("_UID", "0"), ("OBJECT_SYSTEMD_UNIT", None)),
+)
+
+# Journal PRIORITY field values to priority names
+_JOURNAL_PRIORITIES = {
+    "0": "emerg",
+    "1": "alert",
+    "2": "crit",
+    "3": "err",
+    "4": "warning",
+    "5": "notice",
+    "6": "info",
+    "7": "debug"
+}
+
+# Severity rank of each priority name, most severe first
+_PRIORITY_RANK = {name: int(level) for level, name in _JOURNAL_PRIORITIES.items()}
+
+# Priority name to the severity class get_log_statistics counts it under
+_SEVERITY_CLASSES = {
+    "emerg": "error",
+    "alert": "error",
+    "crit": "error",
+    "err": "error",
+    "warning": "warning",
+    "notice": "info",
+    "info": "info",
+    "debug": "debug"
+}
+
+# Keywords that hint at the priority of a free-form log line
+_LINE_PRIO_RE = re.compile(r'error|err:|warning|warn:|notice|debug', re.IGNORECASE)
+
+# Keywords that hint at the priority of a log message of unknown format
+_PRIO_RE = re.compile(r'emerg|alert|crit|err|warn|notice|debug', re.IGNORECASE)
+
+# Priority keyword to priority name
+_PRIO_MAP = {
+    "emerg": "emerg",
+    "alert": "alert",
+    "crit": "crit",
+    "err": "err",
+    "err:": "err",
+    "error": "err",
+    "warn": "warning",
+    "warn:": "warning",
+    "warning": "warning",
+    "notice": "notice",
+    "debug": "debug"
+}
+
+# Error categories looked for by analyze_logs
+_ERROR_PATTERNS = (
+    "error", "fail", "exception", "crash", "segfault", "core dump",
+    "killed", "fatal", "panic", "critical"
+)
+
+# Single alternation matching all error categories in one scan; case is
+# folded for ASCII letters only, so every match lowercases to a category
+_ERROR_UNION = re.compile(
+    "(" + "|".join(re.escape(p) for p in _ERROR_PATTERNS) + ")", re.IGNORECASE | re.ASCII
+)
+
+# Lowercasing of ASCII letters only, matching the regex's case folding; it
+# keeps every message the same length, so offsets stay aligned
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+# Literal automaton over the error categories, scanned against lowercased messages
+if ahocorasick is not None:
+    _ERROR_AUTOMATON = ahocorasick.Automaton()
+    for _pattern in _ERROR_PATTERNS:
+        _ERROR_AUTOMATON.add_word(_pattern, _pattern)
+    _ERROR_AUTOMATON.make_automaton()
+else:
+    _ERROR_AUTOMATON = None
+
+
+def _current_year_month() -> Tuple[int, int]:
+    """Get the current year and month, refreshed at most once a minute.
+    
+    Returns:
+        Tuple of year and month
+    """
+    now = time.monotonic()
+    if now >= _year_month_cache[2]:
+        today = datetime.now()
+        _year_month_cache[:] = [today.year, today.month, now + 60.0]
+    return _year_month_cache[0], _year_month_cache[1]
+
+
+def _parse_syslog_ts(month: str, day: str, clock: str) -> Optional[float]:
+    """Parse the "Apr 25 15:24:01" timestamp of a syslog line.
+    
+    Syslog timestamps carry no year; the current year is assumed, or the
+    previous one for months later than the current month.
+    
+    Args:
+        month: Month abbreviation
+        day: Day of month
+        clock: Time of day as HH:MM:SS
+    
+    Returns:
+        Timestamp or None if not parseable
+    """
+    year, current_month = _current_year_month()
+    return _syslog_ts(month, day, clock, year, current_month)
+
+
+@functools.lru_cache(maxsize=4096)
+def _syslog_ts(month: str, day: str, clock: str, year: int, current_month: int) -> Optional[float]:
+    """Compute a syslog timestamp; cached since nearby lines share timestamps.
+    
+    Args:
+        month: Month abbreviation
+        day: Day of month
+        clock: Time of day as HH:MM:SS
+        year: Current year
+        current_month: Current month
+    
+    Returns:
+        Timestamp or None if not parseable
+    """
+    try:
+        mon = _MONTHS[month]
+        hour, minute, second = clock.split(":")
+        if mon > current_month:
+            year -= 1
+        return datetime(year, mon, int(day), int(hour), int(minute), int(second)).timestamp()
+    except (KeyError, ValueError):
+        return None
+
+
+def _journal_time_spec(spec: str) -> str:
+    """Translate a relative time specification ("30m", "2h", "1d") for journalctl.
+    
+    Args:
+        spec: Time specification
+    
+    Returns:
+        Equivalent journalctl time specification; anything else is passed through
+    """
+    unit = _JOURNAL_TIME_UNITS.get(spec[-1:])
+    if unit and spec[:-1].isdigit():
+        return f"{spec[:-1]} {unit} ago"
+    return spec
+
+
+def _journal_unit_name(unit: str) -> Optional[str]:
+    """Get the unit name journalctl -u matches for a unit argument.
+    
+    Args:
+        unit: Unit name, with or without its type suffix
+    
+    Returns:
+        Full unit name, or None for glob patterns and slices, which journalctl
+        matches with rules beyond _JOURNAL_UNIT_TERMS
+    """
+    if any(char in unit for char in "*?["):
+        return None
+    if unit.rpartition(".")[2] not in _UNIT_TYPES:
+        unit += ".service"
+    if unit.endswith(".slice"):
+        return None
+    return unit
+
+
+def _guess_priority(pattern: Pattern[str], text: str) -> str:
+    """Guess a priority from the most severe keyword found in a text.
+    
+    Args:
+        pattern: Compiled alternation of priority keywords
+        text: Log line or message
+    
+    Returns:
+        Priority name, "info" if no keyword is found
+    """
+    found = pattern.findall(text)
+    if not found:
+        return "info"
+    return min((_PRIO_MAP[keyword.lower()] for keyword in found), key=_PRIORITY_RANK.get)
+
+
+def _classify_messages(messages: List[str]) -> Dict[str, List[int]]:
+    """Find which messages mention each error category.
+    
+    The messages are joined into one buffer and scanned in a single pass;
+    match positions are mapped back to message indexes through the start
+    offsets of each message.
+    
+    Args:
+        messages: Log messages
+    
+    Returns:
+        Dictionary mapping each error category to the ascending indexes of the
+        messages that mention it
+    """
+    texts = [m if isinstance(m, str) else str(m) for m in messages]
+    if _ERROR_AUTOMATON is not None:
+        # Lowercase ASCII per message, like the regex, so that both backends
+        # agree and offsets stay aligned with the buffer
+        texts = [t.translate(_ASCII_LOWER) for t in texts]
+        # iter() reports the end position of each match
+        matches = _ERROR_AUTOMATON.iter("\n".join(texts))
+    else:
+        matches = ((m.start(), m.group(1).lower())
+                   for m in _ERROR_UNION.finditer("\n".join(texts)))
+    
+    starts = list(accumulate((len(t) + 1 for t in texts), initial=0))
+    hits = {pattern: [] for pattern in _ERROR_PATTERNS}
+    for position, pattern in matches:
+        index = bisect_right(starts, position) - 1
+        indexes = hits[pattern]
+        # Matches arrive in buffer order, so repeats within a message are adjacent
+        if not indexes or indexes[-1] != index:
+            indexes.append(index)
+    return hits
+
 
 class LogOperations:
     """Class for system log operations on Linux systems."""
@@ -59,13 +373,47 @@ class LogOperations:
         self.default_max_entries = 1000
         if hasattr(config, "logs") and hasattr(config.logs, "max_entries"):
             self.default_max_entries = config.logs.max_entries
+        
+        # Tool availability, probed once per process
+        self._ausearch_path = shutil.which("ausearch")
+        self._dmesg_supports_json: Optional[bool] = None
+        self._kmsg_readable: Optional[bool] = None
+        
+        # LRU cache of recent query results: key -> (monotonic time, result)
+        self._cache: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Optional background journalctl -f follower keeping the newest entries
+        self._follow_journal = False
+        if hasattr(config, "logs") and hasattr(config.logs, "follow_journal"):
+            self._follow_journal = config.logs.follow_journal
+        self._follower: Optional[subprocess.Popen] = None
+        self._ring: deque = deque(maxlen=self.default_max_entries)
+        self._ring_truncated = False
+        self._ring_lock = threading.Lock()
+        self._follower_start_lock = threading.Lock()
+    
+    def clear_cache(self) -> None:
+        """Drop all cached query results."""
+        with self._cache_lock:
+            self._cache.clear()
+    
+    def close(self) -> None:
+        """Stop the background journal follower, if running."""
+        with self._ring_lock:
+            follower, self._follower = self._follower, None
+        if follower is not None and follower.poll() is None:
+            follower.terminate()
+            follower.wait()
     
     def get_journal_logs(self, 
                         count: int = 100,
                         since: Optional[str] = None, 
                         until: Optional[str] = None,
                         unit: Optional[str] = None,
-                        priority: Optional[str] = None) -> List[Dict[str, Any]]:
+                        priority: Optional[str] = None,
+                        fields: Optional[Tuple[str, ...]] = None,
+                        raw: bool = False) -> List[Dict[str, Any]]:
         """Get logs from systemd journal.
         
         Args:
@@ -74,45 +422,45 @@ class LogOperations:
             until: Time to end at
             unit: Filter by systemd unit
             priority: Filter by priority (0-7, emerg to debug)
+            fields: Only include these journal fields in each entry
+            raw: Return plain text lines instead of structured journal entries
         
         Returns:
             List of log entries
         """
         try:
             # Construct the journalctl command
-            cmd = ["journalctl", "-o", "json"]
+            cmd = ["journalctl", "-o", "short-iso" if raw else "json"]
             
             # Apply filters
             if since:
-                cmd.extend(["--since", since])
+                cmd.extend(["--since", _journal_time_spec(since)])
             if until:
-                cmd.extend(["--until", until])
+                cmd.extend(["--until", _journal_time_spec(until)])
             if unit:
                 cmd.extend(["-u", unit])
             if priority:
                 cmd.extend(["-p", priority])
+            if fields and not raw:
+                cmd.append("--output-fields=" + ",".join(fields))
             
             # Limit the number of entries
             cmd.extend(["-n", str(count)])
             
-            # Execute the command
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode != 0:
-                logger.error(f"Error getting journal logs: {result.stderr}")
-                return [{"error": result.stderr}]
-            
-            # Parse the output
-            logs = []
-            for line in result.stdout.strip().split("\n"):
-                if line:  # Skip empty lines
-                    try:
-                        log_entry = json.loads(line)
-                        logs.append(log_entry)
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Error parsing journal log entry: {e}")
-            
-            return logs
+            # Execute the command and parse the output as it streams in,
+            # reusing the result of an identical recent query
+            key = ("journal", count, since, until, unit, priority, fields, raw)
+            try:
+                if raw:
+                    return self._cached(key, _JOURNAL_CACHE_TTL,
+                                        lambda: self._read_journal_text(cmd))
+                return self._cached(key, _JOURNAL_CACHE_TTL, lambda: self._query_journal(
+                    cmd, "journal log entry", count, since=since, until=until,
+                    unit=unit, priority=priority, fields=fields
+                ))
+            except RuntimeError as e:
+                logger.error(f"Error getting journal logs: {e}")
+                return [{"error": str(e)}]
         
         except Exception as e:
             logger.error(f"Error getting journal logs: {e}")
@@ -136,42 +484,50 @@ class LogOperations:
         """
         try:
             log_path = self.log_paths.get(log_type)
-            if not log_path or not os.path.exists(log_path):
+            st = self._stat_or_none(log_path) if log_path else None
+            if st is None:
                 logger.error(f"Log file not found: {log_path}")
                 return [{"error": f"Log file not found: {log_path}"}]
             
-            # Construct the command to read the log file
-            cmd = ["tail", "-n", str(count), log_path]
-            
-            # Execute the command
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            # When filtering by time, scan newest lines first and stop once
+            # enough entries inside the window are found
+            if since or until:
+                try:
+                    # Read with pread rather than mmap: a live log truncated by
+                    # logrotate copytruncate raises an error instead of SIGBUS
+                    lines = self._iter_lines_reverse(log_path)
+                    with closing(lines):
+                        return self._collect_lines_reverse(lines, log_type, count, since, until)
+                except PermissionError:
+                    pass
             
-            if result.returncode != 0:
-                logger.error(f"Error reading log file: {result.stderr}")
-                return [{"error": result.stderr}]
+            # Read the last lines of the log file
+            try:
+                lines = self._tail_lines(log_path, count)
+            except RuntimeError as e:
+                logger.error(f"Error reading log file: {e}")
+                return [{"error": str(e)}]
             
             # Parse the output
-            logs = []
-            for line in result.stdout.strip().split("\n"):
-                if line:  # Skip empty lines
-                    # Try to parse the log entry
-                    log_entry = self._parse_syslog_line(line, log_type)
-                    
-                    # Apply time filtering if needed
-                    if since or until:
-                        if "timestamp" in log_entry:
-                            # Check if the entry should be included based on timestamps
-                            if self._filter_by_time(log_entry["timestamp"], since, until):
-                                logs.append(log_entry)
-                        else:
-                            # If timestamp parsing failed, include the entry anyway
-                            logs.append(log_entry)
-                    else:
-                        # No time filtering, include all entries
-                        logs.append(log_entry)
+            start_time, end_time = self._resolve_time_bounds(since, until)
+            lines = [line for line in lines if line]  # Skip empty lines
+            timestamps = [self._peek_syslog_timestamp(line) for line in lines]
+            
+            # Apply time filtering on the timestamp alone before the full parse;
+            # entries without a parseable timestamp are included
+            if start_time or end_time:
+                kept = [
+                    i for i, timestamp in enumerate(timestamps)
+                    if timestamp is None or not (
+                        (start_time and timestamp < start_time) or
+                        (end_time and timestamp > end_time))
+                ]
+                lines = [lines[i] for i in kept]
+                timestamps = [timestamps[i] for i in kept]
             
             # Keep only the requested number of entries
-            return logs[-count:]
+            batch = self._parse_syslog_batch(lines[-count:], log_type, timestamps[-count:])
+            return self._batch_to_records(batch)
         
         except Exception as e:
             logger.error(f"Error getting system logs: {e}")
@@ -187,45 +543,57 @@ class LogOperations:
             List of log entries
         """
         try:
-            # Run the dmesg command
-            cmd = ["dmesg", "--json"]
+            # Read the kernel ring buffer directly, unless /dev/kmsg is known to be unreadable
+            if self._kmsg_readable is not False:
+                logs = self._read_kmsg(count)
+                self._kmsg_readable = logs is not None
+                if logs is not None:
+                    return logs
             
-            # Execute the command
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            # Run the dmesg command, unless --json is already known to fail
+            result = None
+            if self._dmesg_supports_json is not False:
+                cmd = ["dmesg", "--json"]
+                result = subprocess.run(cmd, capture_output=True)
+                self._dmesg_supports_json = result.returncode == 0
             
-            if result.returncode != 0:
+            if not self._dmesg_supports_json:
                 # If JSON format fails, try standard format
                 cmd = ["dmesg"]
-                result = subprocess.run(cmd, capture_output=True, text=True)
+                result = subprocess.run(cmd, capture_output=True)
                 
                 if result.returncode != 0:
-                    logger.error(f"Error getting dmesg logs: {result.stderr}")
-                    return [{"error": result.stderr}]
+                    stderr = result.stderr.decode("utf-8", "replace")
+                    logger.error(f"Error getting dmesg logs: {stderr}")
+                    return [{"error": stderr}]
                 
-                # Parse standard format
+                # Parse standard format, decoding only the lines we return
                 logs = []
-                for line in result.stdout.strip().split("\n")[-count:]:
+                for line in result.stdout.splitlines()[-count:]:
                     if line:  # Skip empty lines
-                        log_entry = self._parse_dmesg_line(line)
+                        log_entry = self._parse_dmesg_line(line.decode("utf-8", "replace"))
                         logs.append(log_entry)
                 
                 return logs
             
             # Parse the JSON output
             try:
-                all_logs = json.loads(result.stdout)
+                all_logs = _json_loads(result.stdout)
+                # util-linux wraps the records in a {"dmesg": [...]} object
+                if isinstance(all_logs, dict):
+                    all_logs = all_logs.get("dmesg", [])
                 # Return the last 'count' entries
                 return all_logs[-count:]
             except json.JSONDecodeError:
                 # If JSON parsing fails, try line-by-line parsing
                 logs = []
-                for line in result.stdout.strip().split("\n")[-count:]:
+                for line in result.stdout.splitlines()[-count:]:
                     if line:  # Skip empty lines
                         try:
-                            log_entry = json.loads(line)
+                            log_entry = _json_loads(line)
                             logs.append(log_entry)
                         except json.JSONDecodeError:
-                            log_entry = self._parse_dmesg_line(line)
+                            log_entry = self._parse_dmesg_line(line.decode("utf-8", "replace"))
                             logs.append(log_entry)
                 
                 return logs
@@ -303,12 +671,9 @@ class LogOperations:
         """
         try:
             # First check if ausearch is available
-            ausearch_available = subprocess.run(["which", "ausearch"], 
-                                              capture_output=True).returncode == 0
-            
-            if ausearch_available:
+            if self._ausearch_path:
                 # Construct the command
-                cmd = ["ausearch", "-i"]
+                cmd = [self._ausearch_path, "-i"]
                 
                 if since:
                     # Convert since to a start time for ausearch
@@ -332,7 +697,7 @@ class LogOperations:
                     return [{"error": result.stderr}]
                 
                 # Parse the output
-                return self._parse_audit_logs(result.stdout, count)
+                return self._parse_audit_logs(result.stdout.splitlines(), count)
             
             # Try reading directly from audit log file
             log_path = self.log_paths.get("audit")
@@ -341,53 +706,57 @@ class LogOperations:
                 return [{"error": "Audit log file not found and ausearch not available"}]
             
             # Read the log file
-            cmd = ["tail", "-n", str(count * 5), log_path]  # Read more than needed for filtering
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode != 0:
-                logger.error(f"Error reading audit log file: {result.stderr}")
-                return [{"error": result.stderr}]
+            try:
+                lines = self._tail_lines(log_path, count * 5)  # Read more than needed for filtering
+            except RuntimeError as e:
+                logger.error(f"Error reading audit log file: {e}")
+                return [{"error": str(e)}]
             
             # Parse the output
-            logs = self._parse_audit_logs(result.stdout, count)
+            logs = self._parse_audit_logs(lines, count)
             return logs
         
         except Exception as e:
             logger.error(f"Error getting audit logs: {e}")
             return [{"error": str(e)}]
     
-    def get_boot_logs(self, count: int = 1) -> List[Dict[str, Any]]:
+    def get_boot_logs(self, count: int = 1, raw: bool = False) -> List[Dict[str, Any]]:
         """Get boot logs.
         
         Args:
             count: Number of boot sessions to return (1 for current boot)
+            raw: Return plain text lines instead of structured journal entries
         
         Returns:
             List of boot log entries
         """
         try:
             # Check if we can use journalctl for boot logs
-            cmd = ["journalctl", "-b", "-o", "json", "-n", "100"]
-            
-            # Execute the command
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            if raw:
+                cmd = ["journalctl", "-b", "-o", "short-iso", "-n", "100"]
+            else:
+                cmd = ["journalctl", "-b", "-o", "json", "-n", "100"]
             
-            if result.returncode != 0:
-                logger.error(f"Error getting boot logs from journalctl: {result.stderr}")
+            # Execute the command and parse the output as it streams in
+            try:
+                if raw:
+                    return self._read_journal_text(cmd)
+                return self._query_journal(cmd, "boot log entry", 100, this_boot=True)
+            except RuntimeError as e:
+                logger.error(f"Error getting boot logs from journalctl: {e}")
                 
                 # Try alternate approach - read from /var/log/boot.log
                 log_path = self.log_paths.get("boot")
                 if log_path and os.path.exists(log_path):
-                    cmd = ["tail", "-n", "100", log_path]
-                    result = subprocess.run(cmd, capture_output=True, text=True)
-                    
-                    if result.returncode != 0:
-                        logger.error(f"Error reading boot log file: {result.stderr}")
-                        return [{"error": result.stderr}]
+                    try:
+                        lines = self._tail_lines(log_path, 100)
+                    except RuntimeError as e:
+                        logger.error(f"Error reading boot log file: {e}")
+                        return [{"error": str(e)}]
                     
                     # Parse the output
                     logs = []
-                    for line in result.stdout.strip().split("\n"):
+                    for line in lines:
                         if line:  # Skip empty lines
                             logs.append({
                                 "message": line,
@@ -398,18 +767,6 @@ class LogOperations:
                     return logs
                 else:
                     return [{"error": "Boot logs not available"}]
-            
-            # Parse the output from journalctl
-            logs = []
-            for line in result.stdout.strip().split("\n"):
-                if line:  # Skip empty lines
-                    try:
-                        log_entry = json.loads(line)
-                        logs.append(log_entry)
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Error parsing boot log entry: {e}")
-            
-            return logs
         
         except Exception as e:
             logger.error(f"Error getting boot logs: {e}")
@@ -429,24 +786,12 @@ class LogOperations:
             # Construct the command to get service status logs
             cmd = ["journalctl", "-u", service, "--output=json", "-n", str(count)]
             
-            # Execute the command
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode != 0:
-                logger.error(f"Error getting service logs: {result.stderr}")
-                return [{"error": result.stderr}]
-            
-            # Parse the output
-            logs = []
-            for line in result.stdout.strip().split("\n"):
-                if line:  # Skip empty lines
-                    try:
-                        log_entry = json.loads(line)
-                        logs.append(log_entry)
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Error parsing service log entry: {e}")
-            
-            return logs
+            # Execute the command and parse the output as it streams in
+            try:
+                return self._query_journal(cmd, "service log entry", count, unit=service)
+            except RuntimeError as e:
+                logger.error(f"Error getting service logs: {e}")
+                return [{"error": str(e)}]
         
         except Exception as e:
             logger.error(f"Error getting service logs: {e}")
@@ -485,11 +830,14 @@ class LogOperations:
                 # Add more sources as needed
             }
             
-            # Search each requested source
-            for source in sources:
-                if source in source_map:
-                    search_func = source_map[source]
-                    matches = search_func(query, count, since, until)
+            # Search the requested sources concurrently
+            selected = [source for source in sources if source in source_map]
+            with ThreadPoolExecutor(max_workers=max(1, len(selected))) as executor:
+                all_matches = executor.map(
+                    lambda source: source_map[source](query, count, since, until),
+                    selected
+                )
+                for source, matches in zip(selected, all_matches):
                     if matches:
                         results[source] = matches
             
@@ -499,6 +847,49 @@ class LogOperations:
             logger.error(f"Error searching logs: {e}")
             return {"error": str(e)}
     
+    def search_all(self,
+                   query: str,
+                   count: int = 100,
+                   since: Optional[str] = None,
+                   until: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Search the journal, syslog, dmesg and audit logs and merge the matches.
+        
+        Args:
+            query: Search query
+            count: Maximum number of entries to return in total
+            since: Time to start from
+            until: Time to end at
+        
+        Returns:
+            The most recent matching entries across all sources, oldest first
+        """
+        try:
+            searches = {
+                "journal": self._search_journal,
+                "syslog": self._search_syslog,
+                "dmesg": self._search_dmesg,
+                "audit": self._search_audit,
+            }
+            
+            # The searches mostly wait on subprocesses and disk, so run them concurrently
+            merged = []
+            with ThreadPoolExecutor(max_workers=len(searches)) as executor:
+                futures = {
+                    executor.submit(search, query, count, since, until): source
+                    for source, search in searches.items()
+                }
+                for future in as_completed(futures):
+                    source = futures[future]
+                    for entry in future.result():
+                        merged.append(entry if "source" in entry else {**entry, "source": source})
+            
+            merged.sort(key=lambda entry: self._extract_timestamp(entry) or 0)
+            return merged[-count:]
+        
+        except Exception as e:
+            logger.error(f"Error searching logs: {e}")
+            return [{"error": str(e)}]
+    
     def analyze_logs(self, 
                     sources: List[str] = ["journal", "syslog"],
                     since: Optional[str] = "1h",
@@ -528,35 +919,8 @@ class LogOperations:
                 "potential_issues": []
             }
             
-            # Get logs from each source
-            all_logs = {}
-            
-            for source in sources:
-                if source == "journal":
-                    logs = self.get_journal_logs(
-                        count=self.default_max_entries,
-                        since=since,
-                        until=until
-                    )
-                elif source == "syslog":
-                    logs = self.get_system_logs(
-                        count=self.default_max_entries,
-                        since=since,
-                        until=until,
-                        log_type="syslog"
-                    )
-                elif source == "dmesg":
-                    logs = self.get_dmesg(count=self.default_max_entries)
-                else:
-                    # Try as a system log type
-                    logs = self.get_system_logs(
-                        count=self.default_max_entries,
-                        since=since,
-                        until=until,
-                        log_type=source
-                    )
-                
-                all_logs[source] = logs
+            # Get logs from each source concurrently
+            all_logs = self._fetch_sources(sources, self.default_max_entries, since, until)
             
             # Process each source
             for source, logs in all_logs.items():
@@ -564,34 +928,26 @@ class LogOperations:
                 priorities = {"emerg": 0, "alert": 0, "crit": 0, "err": 0, 
                              "warning": 0, "notice": 0, "info": 0, "debug": 0}
                 
-                # Patterns to look for
-                error_patterns = [
-                    r"error", r"fail", r"exception", r"crash", r"segfault", r"core dump",
-                    r"killed", r"fatal", r"panic", r"critical"
-                ]
-                
-                issue_counts = {pattern: 0 for pattern in error_patterns}
-                error_examples = {pattern: [] for pattern in error_patterns}
+                # Entry layout is fixed per source, so pick the extractors once
+                extract_priority, extract_message = self._get_extractors(source)
                 
-                for entry in logs:
-                    # Check priority
-                    priority = self._extract_priority(entry)
+                for priority in map(extract_priority, logs):
                     if priority in priorities:
                         priorities[priority] += 1
-                    
-                    # Count errors by category
-                    message = self._extract_message(entry).lower()
-                    for pattern in error_patterns:
-                        if re.search(pattern, message):
-                            issue_counts[pattern] += 1
-                            
-                            # Store example of the issue
-                            if len(error_examples[pattern]) < 3:  # Store up to 3 examples
-                                error_examples[pattern].append({
-                                    "message": self._extract_message(entry),
-                                    "timestamp": self._extract_timestamp(entry),
-                                    "source": source
-                                })
+                
+                # Count errors by category, once per category per message,
+                # scanning all messages of the source in one pass
+                messages = list(map(extract_message, logs))
+                hits = _classify_messages(messages)
+                issue_counts = {pattern: len(indexes) for pattern, indexes in hits.items()}
+                error_examples = {
+                    pattern: [{
+                        "message": messages[i],
+                        "timestamp": self._extract_timestamp(logs[i]),
+                        "source": source
+                    } for i in indexes[:3]]  # Store up to 3 examples
+                    for pattern, indexes in hits.items()
+                }
                 
                 # Add to summary
                 analysis["summary"][source] = {
@@ -664,30 +1020,11 @@ class LogOperations:
                 day = (datetime.now() - timedelta(days=i)).strftime("%Y-%m-%d")
                 statistics["entries_per_day"][day] = 0
             
+            # Get logs from each source concurrently
+            all_logs = self._fetch_sources(sources, self.default_max_entries * days, start_str, None)
+            
             # Analyze each source
-            for source in sources:
-                # Get logs
-                logs = []
-                
-                if source == "journal":
-                    logs = self.get_journal_logs(
-                        count=self.default_max_entries * days,
-                        since=start_str
-                    )
-                elif source == "syslog":
-                    logs = self.get_system_logs(
-                        count=self.default_max_entries * days,
-                        since=start_str,
-                        log_type="syslog"
-                    )
-                else:
-                    # Try as a system log type
-                    logs = self.get_system_logs(
-                        count=self.default_max_entries * days,
-                        since=start_str,
-                        log_type=source
-                    )
-                
+            for source, logs in all_logs.items():
                 # Count entries by day and severity
                 daily_counts = {}
                 severity_counts = {
@@ -698,24 +1035,29 @@ class LogOperations:
                     "other": 0
                 }
                 
+                # Bounds of the last seen local day; entries arrive in time
+                # order, so most of them fall into the same day
+                day_start = day_end = None
+                day = None
+                
+                # Entry layout is fixed per source, so pick the extractor once
+                extract_priority, _ = self._get_extractors(source)
+                
                 for entry in logs:
                     # Count by day
-                    day = self._extract_day(entry)
-                    if day:
+                    timestamp = self._extract_timestamp(entry)
+                    if timestamp:
+                        if day_start is None or not day_start <= timestamp < day_end:
+                            midnight = datetime.fromtimestamp(timestamp).replace(
+                                hour=0, minute=0, second=0, microsecond=0)
+                            day_start = midnight.timestamp()
+                            day_end = (midnight + timedelta(days=1)).timestamp()
+                            day = midnight.strftime("%Y-%m-%d")
                         daily_counts[day] = daily_counts.get(day, 0) + 1
                     
                     # Count by severity
-                    priority = self._extract_priority(entry)
-                    if priority in ["emerg", "alert", "crit", "err"]:
-                        severity_counts["error"] += 1
-                    elif priority == "warning":
-                        severity_counts["warning"] += 1
-                    elif priority in ["info", "notice"]:
-                        severity_counts["info"] += 1
-                    elif priority == "debug":
-                        severity_counts["debug"] += 1
-                    else:
-                        severity_counts["other"] += 1
+                    severity = _SEVERITY_CLASSES.get(extract_priority(entry), "other")
+                    severity_counts[severity] += 1
                 
                 # Add to statistics
                 statistics["sources"][source] = {
@@ -744,98 +1086,280 @@ class LogOperations:
     def list_available_logs(self) -> Dict[str, Any]:
         """List all available log sources on the system.
         
+        The result is cached briefly, since enumerating journal units scans
+        the whole journal.
+        
         Returns:
             Dictionary with available log sources and their details
         """
         try:
-            available_logs = {
-                "system_logs": [],
-                "journal_units": [],
-                "application_logs": [],
-                "special_logs": []
-            }
-            
-            # Check standard system logs
-            system_log_types = ["syslog", "auth", "daemon", "kern", "mail", "user", "messages"]
-            for log_type in system_log_types:
-                path = self.log_paths.get(log_type)
-                if path and os.path.exists(path):
-                    available_logs["system_logs"].append({
-                        "name": log_type,
-                        "path": path,
-                        "size": os.path.getsize(path)
-                    })
-            
-            # Check journal units
-            try:
-                cmd = ["journalctl", "--field=_SYSTEMD_UNIT"]
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                
-                if result.returncode == 0:
-                    units = sorted(list(set(result.stdout.strip().split("\n"))))
-                    for unit in units:
-                        if unit and ".service" in unit:
-                            available_logs["journal_units"].append({
-                                "name": unit,
-                                "type": "systemd"
-                            })
-            except Exception as e:
-                logger.error(f"Error listing journal units: {e}")
-            
-            # Check application logs
-            app_log_types = ["apache_access", "apache_error", "mysql", "postgresql"]
-            for log_type in app_log_types:
-                path = self.log_paths.get(log_type)
-                if path and os.path.exists(path):
-                    available_logs["application_logs"].append({
-                        "name": log_type,
-                        "path": path,
-                        "size": os.path.getsize(path)
-                    })
-            
-            # Check special logs
-            special_log_types = ["audit", "boot"]
-            for log_type in special_log_types:
-                path = self.log_paths.get(log_type)
-                if path and os.path.exists(path):
-                    available_logs["special_logs"].append({
-                        "name": log_type,
-                        "path": path,
-                        "size": os.path.getsize(path)
-                    })
-            
-            # Add special source for systemd journal
-            available_logs["special_logs"].append({
-                "name": "journal",
-                "type": "journald",
-                "description": "Systemd journal logs"
-            })
-            
-            # Add special source for kernel messages
-            available_logs["special_logs"].append({
-                "name": "dmesg",
-                "type": "kernel",
-                "description": "Kernel ring buffer messages"
-            })
-            
-            return available_logs
-        
+            return self._cached(("available_logs",), _AVAILABLE_LOGS_TTL,
+                                self._list_available_logs)
         except Exception as e:
             logger.error(f"Error listing available logs: {e}")
             return {"error": str(e)}
     
+    def _list_available_logs(self) -> Dict[str, Any]:
+        """Enumerate the available log sources on the system.
+        
+        Returns:
+            Dictionary with available log sources and their details
+        """
+        available_logs = {
+            "system_logs": [],
+            "journal_units": [],
+            "application_logs": [],
+            "special_logs": []
+        }
+        
+        # Stat all known log files with one directory scan per parent
+        existing = self._stat_log_paths()
+        
+        # Check standard system logs
+        system_log_types = ["syslog", "auth", "daemon", "kern", "mail", "user", "messages"]
+        for log_type in system_log_types:
+            path = self.log_paths.get(log_type)
+            if path in existing:
+                available_logs["system_logs"].append({
+                    "name": log_type,
+                    "path": path,
+                    "size": existing[path].st_size,
+                    "mtime": existing[path].st_mtime
+                })
+        
+        # Check journal units
+        try:
+            cmd = ["journalctl", "--field=_SYSTEMD_UNIT"]
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            
+            if result.returncode == 0:
+                units = sorted({unit for unit in result.stdout.splitlines()
+                                if unit.endswith(".service")})
+                available_logs["journal_units"] = [
+                    {"name": unit, "type": "systemd"} for unit in units
+                ]
+        except Exception as e:
+            logger.error(f"Error listing journal units: {e}")
+        
+        # Check application logs
+        app_log_types = ["apache_access", "apache_error", "mysql", "postgresql"]
+        for log_type in app_log_types:
+            path = self.log_paths.get(log_type)
+            if path in existing:
+                available_logs["application_logs"].append({
+                    "name": log_type,
+                    "path": path,
+                    "size": existing[path].st_size,
+                    "mtime": existing[path].st_mtime
+                })
+        
+        # Check special logs
+        special_log_types = ["audit", "boot"]
+        for log_type in special_log_types:
+            path = self.log_paths.get(log_type)
+            if path in existing:
+                available_logs["special_logs"].append({
+                    "name": log_type,
+                    "path": path,
+                    "size": existing[path].st_size,
+                    "mtime": existing[path].st_mtime
+                })
+        
+        # Add files matched by glob patterns in the configured log paths
+        categories = {log_type: "system_logs" for log_type in system_log_types}
+        categories.update({log_type: "application_logs" for log_type in app_log_types})
+        categories.update({log_type: "special_logs" for log_type in special_log_types})
+        for log_type, matches in self._stat_log_globs().items():
+            category = categories.get(log_type, "application_logs")
+            for path, st in matches:
+                available_logs[category].append({
+                    "name": log_type,
+                    "path": path,
+                    "size": st.st_size,
+                    "mtime": st.st_mtime
+                })
+        
+        # Add special source for systemd journal
+        available_logs["special_logs"].append({
+            "name": "journal",
+            "type": "journald",
+            "description": "Systemd journal logs"
+        })
+        
+        # Add special source for kernel messages
+        available_logs["special_logs"].append({
+            "name": "dmesg",
+            "type": "kernel",
+            "description": "Kernel ring buffer messages"
+        })
+        
+        return available_logs
+    
+    def _stat_or_none(self, path: str) -> Optional[os.stat_result]:
+        """Stat a file, returning None if it cannot be found.
+        
+        Args:
+            path: Path to the file
+        
+        Returns:
+            Stat result, or None if the file does not exist or is not accessible
+        """
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
+    
+    def _stat_log_paths(self) -> Dict[str, os.stat_result]:
+        """Stat the configured log files using one directory scan per parent.
+        
+        Returns:
+            Dictionary mapping existing log file paths to their stat results
+        """
+        # Group the configured paths by parent directory
+        by_dir: Dict[str, Dict[str, str]] = {}
+        for path in self.log_paths.values():
+            if path:
+                by_dir.setdefault(os.path.dirname(path), {})[os.path.basename(path)] = path
+        
+        existing = {}
+        for dirpath, names in by_dir.items():
+            try:
+                with os.scandir(dirpath or ".") as it:
+                    for entry in it:
+                        path = names.get(entry.name)
+                        if path is not None:
+                            try:
+                                existing[path] = entry.stat()
+                            except OSError:
+                                pass
+            except OSError:
+                continue
+        
+        return existing
+    
+    def _stat_log_globs(self) -> Dict[str, List[Tuple[str, os.stat_result]]]:
+        """Stat the files matched by configured log paths with glob file names.
+        
+        Only the file name part of a path may contain a pattern, e.g.
+        /var/log/apache2/*.log. Each directory is scanned once.
+        
+        Returns:
+            Dictionary mapping log types to their matching paths and stat results
+        """
+        # Group the patterns by directory, remembering which log types use them
+        by_dir: Dict[str, Dict[str, List[str]]] = {}
+        for log_type, path in self.log_paths.items():
+            name = os.path.basename(path or "")
+            if any(c in name for c in "*?["):
+                patterns = by_dir.setdefault(os.path.dirname(path), {})
+                patterns.setdefault(name, []).append(log_type)
+        
+        matches: Dict[str, List[Tuple[str, os.stat_result]]] = {}
+        for dirpath, patterns in by_dir.items():
+            try:
+                for pattern, path, st in self._enumerate_log_dir(dirpath or ".", list(patterns)):
+                    for log_type in patterns[pattern]:
+                        matches.setdefault(log_type, []).append((path, st))
+            except OSError:
+                continue
+        
+        for found in matches.values():
+            found.sort()
+        return matches
+    
+    def _enumerate_log_dir(self,
+                           dirpath: str,
+                           patterns: List[str]) -> Iterator[Tuple[str, str, os.stat_result]]:
+        """Find the regular files of a directory matching file name patterns.
+        
+        Uses a single directory scan; the file type comes from the directory
+        entry itself and the stat result is cached on it.
+        
+        Args:
+            dirpath: Directory to scan
+            patterns: fnmatch patterns for file names
+        
+        Yields:
+            Tuples of matching pattern, file path and stat result
+        """
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                for pattern in patterns:
+                    if fnmatch(entry.name, pattern):
+                        yield pattern, entry.path, entry.stat(follow_symlinks=False)
+    
+    def _fetch_source(self,
+                      source: str,
+                      count: int,
+                      since: Optional[str],
+                      until: Optional[str]) -> List[Dict[str, Any]]:
+        """Fetch log entries from a single source for analysis.
+        
+        Journal entries only carry the fields used by the analysis.
+        
+        Args:
+            source: Log source (journal, syslog, dmesg or a system log type)
+            count: Maximum number of entries to return
+            since: Time to start from
+            until: Time to end at
+        
+        Returns:
+            List of log entries
+        """
+        if source == "journal":
+            return self.get_journal_logs(count=count, since=since, until=until,
+                                         fields=_ANALYSIS_FIELDS)
+        elif source == "dmesg":
+            return self.get_dmesg(count=count)
+        
+        # Try as a system log type
+        return self.get_system_logs(count=count, since=since, until=until, log_type=source)
+    
+    def _fetch_sources(self,
+                       sources: List[str],
+                       count: int,
+                       since: Optional[str],
+                       until: Optional[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch log entries from several sources concurrently.
+        
+        Each source blocks on its own subprocess or file read, so the sources
+        are fetched in parallel threads.
+        
+        Args:
+            sources: List of log sources
+            count: Maximum number of entries to return per source
+            since: Time to start from
+            until: Time to end at
+        
+        Returns:
+            Dictionary with log sources as keys and lists of entries as values
+        """
+        with ThreadPoolExecutor(max_workers=max(1, len(sources))) as executor:
+            all_logs = executor.map(
+                lambda source: self._fetch_source(source, count, since, until),
+                sources
+            )
+            return dict(zip(sources, all_logs))
+    
     def _search_journal(self, 
                       query: str,
                       count: int,
                       since: Optional[str],
-                      until: Optional[str]) -> List[Dict[str, Any]]:
+                      until: Optional[str],
+                      priority: Optional[str] = None) -> List[Dict[str, Any]]:
         """Search the systemd journal.
         
+        All filters are applied by journalctl against the journal indexes,
+        so its output is the final result.
+        
         Args:
             query: Search query
             count: Maximum number of entries to return
             since: Time to start from
             until: Time to end at
+            priority: Filter by priority (0-7, emerg to debug)
         
         Returns:
             List of matching log entries
@@ -845,30 +1369,20 @@ class LogOperations:
             cmd = ["journalctl", "-g", query, "-o", "json"]
             
             if since:
-                cmd.extend(["--since", since])
+                cmd.extend(["--since", _journal_time_spec(since)])
             if until:
-                cmd.extend(["--until", until])
+                cmd.extend(["--until", _journal_time_spec(until)])
+            if priority:
+                cmd.extend(["-p", priority])
             
             cmd.extend(["-n", str(count)])
             
-            # Execute the command
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode != 0:
-                logger.error(f"Error searching journal: {result.stderr}")
+            # Execute the command, stopping once enough entries are parsed
+            try:
+                return self._read_journal(cmd, "journald log entry", max_entries=count)
+            except RuntimeError as e:
+                logger.error(f"Error searching journal: {e}")
                 return []
-            
-            # Parse the output
-            logs = []
-            for line in result.stdout.strip().split("\n"):
-                if line:  # Skip empty lines
-                    try:
-                        log_entry = json.loads(line)
-                        logs.append(log_entry)
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Error parsing journald log entry: {e}")
-            
-            return logs
         
         except Exception as e:
             logger.error(f"Error searching journald: {e}")
@@ -912,38 +1426,20 @@ class LogOperations:
         """
         try:
             log_path = self.log_paths.get(log_type)
-            if not log_path or not os.path.exists(log_path):
+            st = self._stat_or_none(log_path) if log_path else None
+            if st is None:
                 logger.error(f"Log file not found: {log_path}")
                 return []
             
-            # Use grep to search the log file
-            cmd = ["grep", "-i", query, log_path]
-            
-            # Execute the command
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode != 0 and result.returncode != 1:  # 1 means no matches found
-                logger.error(f"Error searching log file: {result.stderr}")
-                return []
-            
-            # Parse the output
-            logs = []
-            for line in result.stdout.strip().split("\n"):
-                if line:  # Skip empty lines
-                    log_entry = self._parse_syslog_line(line, log_type)
-                    
-                    # Apply time filtering if needed
-                    if since or until:
-                        if "timestamp" in log_entry:
-                            if self._filter_by_time(log_entry["timestamp"], since, until):
-                                logs.append(log_entry)
-                        else:
-                            logs.append(log_entry)
-                    else:
-                        logs.append(log_entry)
-            
-            # Return only the requested number of entries
-            return logs[:count]
+            # Search the log file from its end, stopping once the most recent
+            # count matches inside the time window are found
+            pattern = re.compile(re.escape(query).encode(), re.IGNORECASE)
+            if st.st_size > _BLOCK_SEARCH_THRESHOLD:
+                lines = self._tail_grep_blocks(log_path, pattern)
+            else:
+                lines = self._tail_grep(log_path, pattern)
+            with closing(lines):
+                return self._collect_lines_reverse(lines, log_type, count, since, until)
         
         except Exception as e:
             logger.error(f"Error searching system log: {e}")
@@ -966,25 +1462,25 @@ class LogOperations:
             List of matching log entries
         """
         try:
-            # Use dmesg | grep to search
-            cmd = ["dmesg", "|", "grep", "-i", query]
-            
-            # Execute the command using shell=True because we need pipe redirection
-            result = subprocess.run(" ".join(cmd), shell=True, capture_output=True, text=True)
-            
-            if result.returncode != 0 and result.returncode != 1:  # 1 means no matches found
-                logger.error(f"Error searching dmesg: {result.stderr}")
-                return []
-            
-            # Parse the output
+            # Filter dmesg output in-process as it streams, stopping at the requested
+            # count; lines are matched as bytes and only matches are decoded
+            pattern = re.compile(re.escape(query).encode(), re.IGNORECASE)
             logs = []
-            for line in result.stdout.strip().split("\n"):
-                if line:  # Skip empty lines
-                    log_entry = self._parse_dmesg_line(line)
-                    logs.append(log_entry)
+            try:
+                with closing(self._iter_command_lines(["dmesg"])) as lines:
+                    for raw in lines:
+                        if not pattern.search(raw):
+                            continue
+                        
+                        line = raw.decode("utf-8", "replace").rstrip("\n")
+                        logs.append(self._parse_dmesg_line(line))
+                        if len(logs) >= count:
+                            break
+            except RuntimeError as e:
+                logger.error(f"Error searching dmesg: {e}")
+                return []
             
-            # Return only the requested number of entries
-            return logs[:count]
+            return logs
         
         except Exception as e:
             logger.error(f"Error searching dmesg: {e}")
@@ -1007,13 +1503,10 @@ class LogOperations:
             List of matching log entries
         """
         try:
-            # Check if ausearch is available
-            ausearch_available = subprocess.run(["which", "ausearch"], 
-                                              capture_output=True).returncode == 0
-            
-            if ausearch_available:
+            # Use ausearch if it was found on the PATH at startup
+            if self._ausearch_path:
                 # Construct the command
-                cmd = ["ausearch", "-i"]
+                cmd = [self._ausearch_path, "-i"]
                 
                 if since:
                     # Convert since to a start time for ausearch
@@ -1037,87 +1530,894 @@ class LogOperations:
                     return []
                 
                 # Parse the output
-                return self._parse_audit_logs(result.stdout, count)
+                return self._parse_audit_logs(result.stdout.splitlines(), count)
             
-            # If ausearch is not available, try with grep
+            # If ausearch is not available, search the log file directly
             log_path = self.log_paths.get("audit")
             if not log_path or not os.path.exists(log_path):
                 logger.error(f"Audit log file not found and ausearch not available")
                 return []
             
-            # Use grep to search the log file
-            cmd = ["grep", "-i", query, log_path]
-            
-            # Execute the command
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode != 0 and result.returncode != 1:  # 1 means no matches found
-                logger.error(f"Error searching audit log file: {result.stderr}")
-                return []
+            # Each audit log line is one record, so matching lines are matching records
+            pattern = re.compile(re.escape(query).encode(), re.IGNORECASE)
+            lines = self._grep_file(log_path, pattern, count)
             
             # Parse the output
-            logs = self._parse_audit_logs(result.stdout, count)
+            logs = self._parse_audit_logs(lines, count)
             return logs
         
         except Exception as e:
             logger.error(f"Error searching audit logs: {e}")
             return []
     
-    def _parse_syslog_line(self, line: str, log_type: str) -> Dict[str, Any]:
-        """Parse a syslog line into a structured format.
+    def _cached(self, key: Tuple, ttl: float, fn: Callable[[], Any]) -> Any:
+        """Return a cached result for key, or compute and cache it.
+        
+        Exceptions raised by fn propagate and nothing is cached.
         
         Args:
-            line: Log line
-            log_type: Type of log
+            key: Cache key
+            ttl: Maximum age of a cached result in seconds
+            fn: Function computing a list or dictionary result
         
         Returns:
-            Dictionary with parsed log entry
+            Shallow copy of the cached or freshly computed result
         """
+        with self._cache_lock:
+            hit = self._cache.get(key)
+            if hit is not None and time.monotonic() - hit[0] < ttl:
+                self._cache.move_to_end(key)
+                return hit[1].copy()
+        
+        value = fn()
+        
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), value)
+            self._cache.move_to_end(key)
+            while len(self._cache) > _CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+        
+        return value.copy()
+    
+    def _iter_command_lines(self,
+                            cmd: List[str],
+                            ok_returncodes: Tuple[int, ...] = (0,)) -> Iterator[bytes]:
+        """Run a command and yield its output lines as they arrive.
+        
+        Closing the generator before the output is exhausted terminates the
+        command.
+        
+        Args:
+            cmd: Command to execute
+            ok_returncodes: Exit codes that do not indicate an error
+        
+        Yields:
+            Raw output lines
+        
+        Raises:
+            RuntimeError: If the command exits with an unexpected code
+        """
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                bufsize=1024 * 1024)
+        finished = False
         try:
-            # Common syslog format: Apr 25 15:24:01 hostname process[pid]: message
-            # Try to parse timestamp
-            timestamp = None
-            parts = line.split(" ", 3)
-            if len(parts) >= 3:
+            for line in proc.stdout:
+                yield line
+            finished = True
+        finally:
+            proc.stdout.close()
+            if finished:
+                _, stderr = proc.communicate()
+            else:
+                # Stopped early: ask the command to exit, then force it
+                proc.terminate()
                 try:
-                    # Try to parse the timestamp part (Apr 25 15:24:01)
-                    ts_str = " ".join(parts[:3])
-                    timestamp = time.strptime(ts_str, "%b %d %H:%M:%S")
-                    timestamp = time.mktime(timestamp)
-                except ValueError:
-                    pass
+                    _, stderr = proc.communicate(timeout=_TERMINATE_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    _, stderr = proc.communicate()
+        
+        if proc.returncode not in ok_returncodes:
+            raise RuntimeError(stderr.decode("utf-8", "replace"))
+    
+    def _query_journal(self,
+                       cmd: List[str],
+                       entry_kind: str,
+                       count: int,
+                       **filters: Any) -> List[Dict[str, Any]]:
+        """Read journal entries in-process when possible, else through journalctl.
+        
+        Args:
+            cmd: Equivalent journalctl JSON command
+            entry_kind: Description of the entries, used in error messages
+            count: Maximum number of entries to return
+            **filters: Filters passed to _read_journal_native
+        
+        Returns:
+            List of journal entries
+        
+        Raises:
+            RuntimeError: If journalctl exits with an error
+        """
+        logs = self._read_journal_ring(count, **filters)
+        if logs is None:
+            logs = self._read_journal_native(count, **filters)
+        if logs is None:
+            logs = self._read_journal(cmd, entry_kind)
+        return logs
+    
+    def _ensure_follower(self) -> bool:
+        """Start the background journal follower if enabled and not running.
+        
+        The ring is seeded with the newest journal entries, then a
+        journalctl -f process appends every entry written after them.
+        
+        Returns:
+            True if the follower is running
+        """
+        if not self._follow_journal:
+            return False
+        
+        with self._ring_lock:
+            if self._follower is not None and self._follower.poll() is None:
+                return True
+        
+        # Seed and start without holding the ring lock, so that queries are
+        # not blocked meanwhile; queries arriving while another thread starts
+        # the follower read the journal instead of waiting for it
+        if not self._follower_start_lock.acquire(blocking=False):
+            return False
+        try:
+            with self._ring_lock:
+                if self._follower is not None and self._follower.poll() is None:
+                    return True
             
-            # Try to extract priority/severity
-            priority = "info"  # default
-            if "error" in line.lower() or "err:" in line.lower():
-                priority = "err"
-            elif "warning" in line.lower() or "warn:" in line.lower():
-                priority = "warning"
-            elif "notice" in line.lower():
-                priority = "notice"
-            elif "debug" in line.lower():
-                priority = "debug"
+            try:
+                seed = self._read_journal(
+                    ["journalctl", "-o", "json", "-n", str(self._ring.maxlen)],
+                    "journal log entry"
+                )
+                cmd = ["journalctl", "-f", "-o", "json", "--no-pager"]
+                if seed and "__CURSOR" in seed[-1]:
+                    cmd.append("--after-cursor=" + seed[-1]["__CURSOR"])
+                else:
+                    cmd.extend(["-n", "0"])
+                follower = subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                                            stderr=subprocess.DEVNULL)
+            except (OSError, RuntimeError) as e:
+                logger.error(f"Error starting journal follower, disabling it: {e}")
+                self._follow_journal = False
+                return False
+            
+            with self._ring_lock:
+                self._ring.clear()
+                self._ring.extend(seed)
+                self._ring_truncated = len(seed) >= self._ring.maxlen
+                self._follower = follower
+        finally:
+            self._follower_start_lock.release()
+        
+        threading.Thread(target=self._follow, args=(follower,),
+                         name="journal-follower", daemon=True).start()
+        return True
+    
+    def _follow(self, follower: subprocess.Popen) -> None:
+        """Append entries from a journalctl -f process to the ring until it exits.
+        
+        Args:
+            follower: Running journalctl -f JSON process
+        """
+        with follower.stdout:
+            for line in follower.stdout:
+                try:
+                    entry = _json_loads(line)
+                except json.JSONDecodeError:
+                    continue
+                
+                with self._ring_lock:
+                    if len(self._ring) == self._ring.maxlen:
+                        self._ring_truncated = True
+                    self._ring.append(entry)
+    
+    def _read_journal_ring(self,
+                           count: int,
+                           since: Optional[str] = None,
+                           until: Optional[str] = None,
+                           unit: Optional[str] = None,
+                           priority: Optional[str] = None,
+                           fields: Optional[Tuple[str, ...]] = None,
+                           this_boot: bool = False) -> Optional[List[Dict[str, Any]]]:
+        """Answer a journal query from the follower's ring of newest entries.
+        
+        Args:
+            count: Maximum number of entries to return
+            since: Time to start from
+            until: Time to end at
+            unit: Filter by systemd unit
+            priority: Filter by numeric priority (0-7)
+            fields: Only include these journal fields in each entry
+            this_boot: Only read entries from the current boot
+        
+        Returns:
+            List of journal entries, oldest first, or None if the ring cannot
+            answer the query completely and the journal must be read instead
+        """
+        if this_boot or (priority is not None and not priority.isdigit()):
+            return None
+        try:
+            start_time, end_time = self._resolve_time_bounds(since, until)
+        except ValueError:
+            return None
+        if (since and start_time is None) or (until and end_time is None):
+            return None
+        unit_terms = None
+        if unit:
+            unit_name = _journal_unit_name(unit)
+            if unit_name is None:
+                return None
+            unit_terms = [
+                [(field, unit_name if value is None else value) for field, value in term]
+                for term in _JOURNAL_UNIT_TERMS
+            ]
+        if not self._ensure_follower():
+            return None
+        
+        with self._ring_lock:
+            entries = list(self._ring)
+            truncated = self._ring_truncated
+        
+        levels = {str(level) for level in range(int(priority) + 1)} if priority else None
+        
+        # Walk newest-first; the answer is complete once count entries match or
+        # the walk passes the start of the window, or if nothing was evicted
+        logs = []
+        complete = not truncated
+        for entry in reversed(entries):
+            if start_time or end_time:
+                try:
+                    timestamp = int(entry["__REALTIME_TIMESTAMP"]) / 1000000
+                except (KeyError, ValueError):
+                    continue
+                if start_time and timestamp < start_time:
+                    complete = True
+                    break
+                if end_time and timestamp > end_time:
+                    continue
+            # Same matches as journalctl -u
+            if unit_terms and not any(
+                all(entry.get(field) == value for field, value in term)
+                for term in unit_terms
+            ):
+                continue
+            if levels is not None and entry.get("PRIORITY") not in levels:
+                continue
+            
+            if fields:
+                entry = {key: value for key, value in entry.items()
+                         if key.startswith("__") or key in fields}
+            logs.append(entry)
+            if len(logs) >= count:
+                complete = True
+                break
+        
+        if not complete:
+            return None
+        logs.reverse()
+        return logs
+    
+    def _read_journal_native(self,
+                             count: int,
+                             since: Optional[str] = None,
+                             until: Optional[str] = None,
+                             unit: Optional[str] = None,
+                             priority: Optional[str] = None,
+                             fields: Optional[Tuple[str, ...]] = None,
+                             this_boot: bool = False) -> Optional[List[Dict[str, Any]]]:
+        """Read the most recent journal entries in-process through python-systemd.
+        
+        Entries are returned in the same shape as journalctl's JSON output.
+        
+        Args:
+            count: Maximum number of entries to return
+            since: Time to start from
+            until: Time to end at
+            unit: Filter by systemd unit
+            priority: Filter by numeric priority (0-7)
+            fields: Only include these journal fields in each entry
+            this_boot: Only read entries from the current boot
+        
+        Returns:
+            List of journal entries, oldest first, or None if the query cannot
+            be served natively and journalctl should be used instead
+        """
+        if not _HAS_SDJOURNAL:
+            return None
+        if priority is not None and not priority.isdigit():
+            return None
+        
+        try:
+            start_time, end_time = self._resolve_time_bounds(since, until)
+        except ValueError:
+            return None
+        if (since and start_time is None) or (until and end_time is None):
+            return None
+        unit_name = None
+        if unit:
+            unit_name = _journal_unit_name(unit)
+            if unit_name is None:
+                return None
+        
+        try:
+            reader = sd_journal.Reader()
+            try:
+                if unit_name:
+                    # Same matches as journalctl -u, ANDed with the other filters
+                    for index, term in enumerate(_JOURNAL_UNIT_TERMS):
+                        if index:
+                            reader.add_disjunction()
+                        for field, value in term:
+                            reader.add_match(**{field: unit_name if value is None else value})
+                    reader.add_conjunction()
+                if this_boot:
+                    reader.this_boot()
+                if priority is not None:
+                    reader.log_level(int(priority))
+                
+                # Walk backwards from the newest entry, like journalctl -n
+                reader.seek_tail()
+                logs = []
+                while len(logs) < count:
+                    entry = reader.get_previous()
+                    if not entry:
+                        break
+                    
+                    realtime = entry.get("__REALTIME_TIMESTAMP")
+                    if isinstance(realtime, datetime):
+                        timestamp = realtime.timestamp()
+                        if start_time and timestamp < start_time:
+                            break
+                        if end_time and timestamp > end_time:
+                            continue
+                    
+                    logs.append(self._journal_entry_to_json(entry, fields))
+            finally:
+                reader.close()
+        except OSError as e:
+            logger.error(f"Error reading journal natively: {e}")
+            return None
+        
+        logs.reverse()
+        return logs
+    
+    def _journal_entry_to_json(self,
+                               entry: Dict[str, Any],
+                               fields: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+        """Convert a python-systemd journal entry to journalctl's JSON shape.
+        
+        Args:
+            entry: Entry returned by systemd.journal.Reader
+            fields: Only include these fields, plus the address fields
+        
+        Returns:
+            Dictionary with string field values
+        """
+        result = {}
+        for key, value in entry.items():
+            if fields and not key.startswith("__") and key not in fields:
+                continue
+            
+            if isinstance(value, datetime):
+                value = str(round(value.timestamp() * 1000000))
+            elif isinstance(value, tuple):
+                # __MONOTONIC_TIMESTAMP is a (timedelta, boot id) pair
+                value = value[0]
+            
+            if isinstance(value, timedelta):
+                value = str(value // timedelta(microseconds=1))
+            elif isinstance(value, uuid.UUID):
+                value = value.hex
+            elif isinstance(value, bytes):
+                value = list(value)
+            elif not isinstance(value, str):
+                value = str(value)
+            result[key] = value
+        return result
+    
+    def _read_journal(self,
+                      cmd: List[str],
+                      entry_kind: str,
+                      max_entries: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Run a journalctl JSON command and parse its output.
+        
+        Args:
+            cmd: journalctl command producing one JSON object per line
+            entry_kind: Description of the entries, used in error messages
+            max_entries: Stop reading and terminate journalctl after this many entries
+        
+        Returns:
+            List of parsed journal entries
+        
+        Raises:
+            RuntimeError: If journalctl exits with an error
+        """
+        if max_entries is None:
+            result = subprocess.run(cmd, capture_output=True)
+            if result.returncode != 0:
+                raise RuntimeError(result.stderr.decode("utf-8", "replace"))
             
-            # Extract process name and pid
-            process_name = None
-            pid = None
-            process_match = re.search(r'(\S+)\[(\d+)\]:', line)
-            if process_match:
-                process_name = process_match.group(1)
-                pid = int(process_match.group(2))
+            # Parse all records in one call by turning the output into a JSON array
+            output = result.stdout.strip()
+            if not output:
+                return []
+            try:
+                return _json_loads(b"[" + output.replace(b"\n", b",") + b"]")
+            except json.JSONDecodeError:
+                # Some record is malformed; parse line by line to skip just that one
+                return self._parse_journal_lines(output.splitlines(), entry_kind)
+        
+        with closing(self._iter_command_lines(cmd)) as lines:
+            return self._parse_journal_lines(lines, entry_kind, max_entries)
+    
+    def _read_journal_text(self, cmd: List[str]) -> List[Dict[str, Any]]:
+        """Run a journalctl text output command and return its lines unparsed.
+        
+        Args:
+            cmd: journalctl command producing one line per entry
+        
+        Returns:
+            List of log entries holding just the message line
+        
+        Raises:
+            RuntimeError: If journalctl exits with an error
+        """
+        logs = []
+        with closing(self._iter_command_lines(cmd)) as lines:
+            for line in lines:
+                # Skip blank lines and markers such as "-- Boot ... --"
+                if not line.strip() or line.startswith(b"-- "):
+                    continue
+                logs.append({
+                    "message": line.rstrip(b"\n").decode("utf-8", "replace"),
+                    "source": "journal"
+                })
+        return logs
+    
+    def _parse_journal_lines(self,
+                             lines: Iterable[bytes],
+                             entry_kind: str,
+                             max_entries: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Parse journalctl JSON output line by line, skipping malformed records.
+        
+        Args:
+            lines: Output lines, one JSON object each
+            entry_kind: Description of the entries, used in error messages
+            max_entries: Stop after this many entries
+        
+        Returns:
+            List of parsed journal entries
+        """
+        logs = []
+        for line in lines:
+            if not line.strip():  # Skip empty lines
+                continue
+            try:
+                logs.append(_json_loads(line))
+            except json.JSONDecodeError as e:
+                logger.error(f"Error parsing {entry_kind}: {e}")
+                continue
             
-            return {
-                "message": line,
+            if max_entries is not None and len(logs) >= max_entries:
+                break
+        
+        return logs
+    
+    def _tail_file(self, path: str, n: int, block: int = 65536) -> List[str]:
+        """Read the last lines of a file by seeking backwards from its end.
+        
+        Args:
+            path: Path to the file
+            n: Number of lines to return
+            block: Size of each backward read in bytes
+        
+        Returns:
+            Last n lines of the file, oldest first
+        """
+        if n <= 0:
+            return []
+        
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            pos = os.lseek(fd, 0, os.SEEK_END)
+            chunks = []
+            newlines = 0
+            
+            # Read blocks backwards until n full lines are covered
+            while pos > 0 and newlines <= n:
+                size = min(block, pos)
+                pos -= size
+                chunk = os.pread(fd, size, pos)
+                chunks.append(chunk)
+                newlines += chunk.count(b"\n")
+        finally:
+            os.close(fd)
+        
+        data = b"".join(reversed(chunks))
+        if data.endswith(b"\n"):
+            data = data[:-1]
+        if not data:
+            return []
+        
+        return [line.decode("utf-8", "replace") for line in data.split(b"\n")[-n:]]
+    
+    def _iter_lines_reverse(self, path: str, block: int = 65536) -> Iterator[str]:
+        """Yield the lines of a file newest first, reading blocks backwards.
+        
+        Args:
+            path: Path to the file
+            block: Size of each backward read in bytes
+        
+        Yields:
+            Decoded lines, starting from the end of the file
+        """
+        with closing(self._iter_raw_lines_reverse(path, block)) as lines:
+            for line in lines:
+                yield line.decode("utf-8", "replace")
+    
+    def _iter_raw_lines_reverse(self, path: str, block: int = 65536) -> Iterator[bytes]:
+        """Yield the undecoded lines of a file newest first, reading blocks backwards.
+        
+        Args:
+            path: Path to the file
+            block: Size of each backward read in bytes
+        
+        Yields:
+            Raw lines, starting from the end of the file
+        """
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            pos = os.lseek(fd, 0, os.SEEK_END)
+            carry = b""
+            while pos > 0:
+                size = min(block, pos)
+                pos -= size
+                parts = (os.pread(fd, size, pos) + carry).split(b"\n")
+                
+                # The first part may continue in the previous block
+                carry = parts[0]
+                for line in reversed(parts[1:]):
+                    yield line
+            
+            if carry:
+                yield carry
+        finally:
+            os.close(fd)
+    
+    def _tail_grep(self, path: str, pattern: Pattern[bytes]) -> Iterator[str]:
+        """Yield the lines of a file matching a pattern, newest first.
+        
+        The file is read backwards in blocks, so finding recent matches only
+        touches the end of a large log. Lines are matched as bytes and only
+        matches are decoded.
+        
+        Args:
+            path: Path to the file
+            pattern: Compiled bytes pattern to search each line for
+        
+        Yields:
+            Decoded matching lines, starting from the end of the file
+        """
+        with closing(self._iter_raw_lines_reverse(path)) as lines:
+            for line in lines:
+                if pattern.search(line):
+                    yield line.decode("utf-8", "replace")
+    
+    def _tail_grep_blocks(self, path: str, pattern: Pattern[bytes]) -> Iterator[str]:
+        """Yield the lines of a large file matching a pattern, newest first.
+        
+        The file is read backwards in large blocks with pread, and the pattern
+        runs over each block as a whole, so only matching lines are split out
+        and decoded. Unlike a mapping of the file, reading a live log that is
+        truncated meanwhile cannot raise SIGBUS.
+        
+        Args:
+            path: Path to the file
+            pattern: Compiled bytes pattern to search for
+        
+        Yields:
+            Decoded matching lines, starting from the end of the file
+        """
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            pos = os.lseek(fd, 0, os.SEEK_END)
+            carry = b""
+            while pos > 0:
+                size = min(_SEARCH_BLOCK, pos)
+                pos -= size
+                buf = os.pread(fd, size, pos) + carry
+                
+                # Text before the first newline may continue in the previous block
+                if pos > 0:
+                    nl = buf.find(b"\n")
+                    if nl == -1:
+                        carry = buf
+                        continue
+                    carry, lo = buf[:nl], nl + 1
+                else:
+                    carry, lo = b"", 0
+                
+                # Collect the matching lines of the block in file order
+                spans = []
+                hi = len(buf)
+                search_from = lo
+                while search_from < hi:
+                    match = pattern.search(buf, search_from)
+                    if match is None:
+                        break
+                    start = buf.rfind(b"\n", lo, match.start()) + 1 or lo
+                    end = buf.find(b"\n", match.end())
+                    if end == -1:
+                        end = hi
+                    spans.append((start, end))
+                    search_from = end + 1
+                
+                for start, end in reversed(spans):
+                    yield buf[start:end].decode("utf-8", "replace")
+        finally:
+            os.close(fd)
+    
+    def _grep_file(self, path: str, pattern: Pattern[bytes], count: int) -> List[str]:
+        """Find the first lines of a file matching a pattern.
+        
+        The file is read in large blocks and the pattern runs over each block
+        as a whole, so only matching lines are split out and decoded. Unlike a
+        mapping of the file, reading a live log that is truncated meanwhile
+        cannot raise SIGBUS.
+        
+        Args:
+            path: Path to the file
+            pattern: Compiled bytes pattern to search for
+            count: Maximum number of lines to return
+        
+        Returns:
+            Matching lines, in file order
+        """
+        lines = []
+        with open(path, "rb", buffering=0) as f:
+            carry = b""
+            while len(lines) < count:
+                chunk = f.read(_SEARCH_BLOCK)
+                buf = carry + chunk
+                if not buf:
+                    break
+                
+                # Keep a trailing partial line for the next block
+                if chunk:
+                    nl = buf.rfind(b"\n")
+                    if nl == -1:
+                        carry = buf
+                        continue
+                    buf, carry = buf[:nl], buf[nl + 1:]
+                else:
+                    carry = b""
+                
+                pos = 0
+                while len(lines) < count:
+                    match = pattern.search(buf, pos)
+                    if match is None:
+                        break
+                    
+                    start = buf.rfind(b"\n", 0, match.start()) + 1
+                    end = buf.find(b"\n", match.end())
+                    if end == -1:
+                        end = len(buf)
+                    lines.append(buf[start:end].decode("utf-8", "replace"))
+                    pos = end + 1
+                
+                if not chunk:
+                    break
+        
+        return lines
+    
+    def _collect_lines_reverse(self,
+                               lines: Iterator[str],
+                               log_type: str,
+                               count: int,
+                               since: Optional[str],
+                               until: Optional[str]) -> List[Dict[str, Any]]:
+        """Parse newest-first syslog lines that fall inside a time window.
+        
+        Timestamps are checked before the full parse, and the scan stops at
+        the first line older than the window or once count entries are found.
+        
+        Args:
+            lines: Log lines, newest first
+            log_type: Type of log
+            count: Maximum number of entries to return
+            since: Time to start from
+            until: Time to end at
+        
+        Returns:
+            List of log entries, oldest first
+        """
+        start_time, end_time = self._resolve_time_bounds(since, until)
+        
+        selected = []
+        timestamps = []
+        for line in lines:
+            if not line:  # Skip empty lines
+                continue
+            
+            timestamp = self._peek_syslog_timestamp(line)
+            if timestamp is not None:
+                if start_time and timestamp < start_time:
+                    # Older than the window; everything before is older too
+                    break
+                if end_time and timestamp > end_time:
+                    continue
+            
+            selected.append(line)
+            timestamps.append(timestamp)
+            if len(selected) >= count:
+                break
+        
+        selected.reverse()
+        timestamps.reverse()
+        return self._batch_to_records(self._parse_syslog_batch(selected, log_type, timestamps))
+    
+    def _tail_lines(self, path: str, n: int) -> List[str]:
+        """Read the last lines of a log file.
+        
+        Falls back to the tail command when the file cannot be opened directly.
+        
+        Args:
+            path: Path to the log file
+            n: Number of lines to return
+        
+        Returns:
+            Last n lines of the file, oldest first
+        
+        Raises:
+            RuntimeError: If the file cannot be read
+        """
+        try:
+            return self._tail_file(path, n)
+        except PermissionError:
+            result = subprocess.run(["tail", "-n", str(n), path], capture_output=True, text=True)
+            if result.returncode != 0:
+                raise RuntimeError(result.stderr)
+            return result.stdout.splitlines()
+    
+    def _peek_syslog_timestamp(self, line: str) -> Optional[float]:
+        """Parse only the timestamp prefix of a syslog line.
+        
+        Args:
+            line: Log line
+        
+        Returns:
+            Timestamp or None if the line has no parseable timestamp
+        """
+        # Split on runs of spaces, since single-digit days are padded: "Apr  5"
+        parts = line.split(None, 3)
+        if len(parts) < 3:
+            return None
+        return _parse_syslog_ts(parts[0], parts[1], parts[2])
+    
+    def _parse_syslog_batch(self,
+                            lines: List[str],
+                            log_type: str,
+                            timestamps: Optional[List[Optional[float]]] = None) -> Dict[str, Any]:
+        """Parse syslog lines column by column into parallel lists.
+        
+        Lines have the common syslog format "Apr 25 15:24:01 hostname
+        process[pid]: message". Each field is one list, computed in a single
+        tight loop over all lines: the full line as message, the timestamp,
+        the priority guessed from keywords, and the process name and pid
+        (None when absent).
+        
+        Args:
+            lines: Log lines
+            log_type: Type of log
+            timestamps: Already parsed timestamps of the lines, if available
+        
+        Returns:
+            Dictionary of columns, plus the scalar "source"
+        """
+        if timestamps is None:
+            timestamps = [self._peek_syslog_timestamp(line) for line in lines]
+        process_matches = list(map(_SYSLOG_PROC_RE.search, lines))
+        
+        return {
+            "message": lines,
+            "timestamp": timestamps,
+            "priority": [_guess_priority(_LINE_PRIO_RE, line) for line in lines],
+            "process_name": [m.group(1) if m else None for m in process_matches],
+            "pid": [int(m.group(2)) if m else None for m in process_matches],
+            "source": log_type
+        }
+    
+    def _batch_to_records(self, batch: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Convert a columnar batch from _parse_syslog_batch into log entries.
+        
+        Args:
+            batch: Dictionary of columns
+        
+        Returns:
+            List of log entries with message, timestamp, priority,
+            process_name, pid and source
+        """
+        source = batch["source"]
+        return [
+            {
+                "message": message,
                 "timestamp": timestamp,
                 "priority": priority,
                 "process_name": process_name,
                 "pid": pid,
-                "source": log_type
+                "source": source
             }
+            for message, timestamp, priority, process_name, pid in zip(
+                batch["message"], batch["timestamp"], batch["priority"],
+                batch["process_name"], batch["pid"]
+            )
+        ]
+    
+    def _read_kmsg(self, count: int) -> Optional[List[Dict[str, Any]]]:
+        """Read the last kernel log records from /dev/kmsg.
         
-        except Exception as e:
-            logger.error(f"Error parsing syslog line: {e}")
-            return {"message": line, "source": log_type}
+        Args:
+            count: Maximum number of entries to return
+        
+        Returns:
+            List of log entries in the same format as _parse_dmesg_line, or None
+            if /dev/kmsg cannot be opened
+        """
+        try:
+            fd = os.open(_KMSG_PATH, os.O_RDONLY | os.O_NONBLOCK)
+        except OSError as e:
+            logger.debug(f"Cannot read {_KMSG_PATH}, falling back to dmesg: {e}")
+            return None
+        
+        records = deque(maxlen=count)
+        try:
+            while True:
+                try:
+                    records.append(os.read(fd, _KMSG_RECORD_SIZE))
+                except BlockingIOError:
+                    break
+                except OSError as e:
+                    # EPIPE means records were overwritten while reading; keep going
+                    if e.errno != errno.EPIPE:
+                        raise
+        finally:
+            os.close(fd)
+        
+        # Record timestamps are microseconds on the monotonic clock
+        boot_time = time.time() - time.monotonic()
+        return [self._parse_kmsg_record(record, boot_time) for record in records]
+    
+    def _parse_kmsg_record(self, record: bytes, boot_time: float) -> Dict[str, Any]:
+        """Parse a /dev/kmsg record into a structured format.
+        
+        Args:
+            record: Raw record, "priority,sequence,microseconds,flags;message"
+                followed by optional continuation lines
+            boot_time: Timestamp of system boot
+        
+        Returns:
+            Dictionary with parsed log entry
+        """
+        header, _, body = record.decode("utf-8", "replace").partition(";")
+        message = body.split("\n", 1)[0]
+        fields = header.split(",")
+        seconds_since_boot = int(fields[2]) / 1000000
+        
+        return {
+            "message": message,
+            "raw": f"[{seconds_since_boot:12.6f}] {message}",
+            "timestamp": boot_time + seconds_since_boot,
+            "priority": _JOURNAL_PRIORITIES[str(int(fields[0]) & 7)],
+            "source": "dmesg"
+        }
     
     def _parse_dmesg_line(self, line: str) -> Dict[str, Any]:
         """Parse a dmesg line into a structured format.
@@ -1134,22 +2434,14 @@ class LogOperations:
             message = line
             
             # Try to extract timestamp
-            ts_match = re.match(r'\[\s*(\d+\.\d+)\]', line)
+            ts_match = _DMESG_TS_RE.match(line)
             if ts_match:
                 seconds_since_boot = float(ts_match.group(1))
                 timestamp = time.time() - seconds_since_boot
                 message = line[ts_match.end():].strip()
             
             # Try to extract priority/severity
-            priority = "info"  # default
-            if "error" in line.lower() or "err:" in line.lower():
-                priority = "err"
-            elif "warning" in line.lower() or "warn:" in line.lower():
-                priority = "warning"
-            elif "notice" in line.lower():
-                priority = "notice"
-            elif "debug" in line.lower():
-                priority = "debug"
+            priority = _guess_priority(_LINE_PRIO_RE, line)
             
             return {
                 "message": message,
@@ -1163,48 +2455,48 @@ class LogOperations:
             logger.error(f"Error parsing dmesg line: {e}")
             return {"message": line, "source": "dmesg"}
     
-    def _parse_audit_logs(self, output: str, count: int) -> List[Dict[str, Any]]:
+    def _parse_audit_logs(self, lines: List[str], count: int) -> List[Dict[str, Any]]:
         """Parse audit log output.
         
         Args:
-            output: Output from ausearch or audit log file
+            lines: Output lines from ausearch or audit log file
             count: Maximum number of entries to return
         
         Returns:
             List of parsed audit log entries
         """
         try:
-            logs = []
-            
-            # Split into audit records (each record starts with 'type=')
-            current_record = ""
-            for line in output.split("\n"):
-                if line.startswith("type="):
-                    if current_record:
-                        # Parse the previous record
-                        record = self._parse_audit_record(current_record)
-                        logs.append(record)
-                        
-                        # Check if we have enough records
-                        if len(logs) >= count:
-                            break
-                    
-                    # Start a new record
-                    current_record = line
-                elif line and current_record:
-                    # Continue previous record
-                    current_record += " " + line
-            
-            # Don't forget the last record
-            if current_record and len(logs) < count:
-                record = self._parse_audit_record(current_record)
-                logs.append(record)
-            
-            return logs
+            records = islice(self._iter_audit_records(lines), count)
+            return [self._parse_audit_record(record) for record in records]
         
         except Exception as e:
             logger.error(f"Error parsing audit logs: {e}")
-            return [{"message": output[:100], "source": "audit", "error": str(e)}]
+            return [{"message": "\n".join(lines)[:100], "source": "audit", "error": str(e)}]
+    
+    def _iter_audit_records(self, lines: Iterable[str]) -> Iterator[str]:
+        """Group audit output lines into records.
+        
+        Each record starts with a 'type=' line; following lines are joined
+        onto it with spaces.
+        
+        Args:
+            lines: Output lines from ausearch or audit log file
+        
+        Yields:
+            Audit record strings
+        """
+        parts: List[str] = []
+        for line in lines:
+            if line.startswith("type="):
+                if parts:
+                    yield "".join(parts)
+                parts = [line]
+            elif line and parts:
+                parts.append(" ")
+                parts.append(line)
+        
+        if parts:
+            yield "".join(parts)
     
     def _parse_audit_record(self, record: str) -> Dict[str, Any]:
         """Parse a single audit record.
@@ -1222,18 +2514,12 @@ class LogOperations:
             }
             
             # Extract key-value pairs
-            for pair in record.split(" "):
-                if "=" in pair:
-                    key, value = pair.split("=", 1)
-                    result[key] = value
+            result.update(_AUDIT_KV_RE.findall(record))
             
             # Extract timestamp
-            if "msg=audit" in record and ":" in record:
-                ts_parts = record.split(":", 1)[0].split("(")[-1]
-                try:
-                    result["timestamp"] = float(ts_parts)
-                except ValueError:
-                    pass
+            ts_match = _AUDIT_TS_RE.search(record)
+            if ts_match:
+                result["timestamp"] = float(ts_match.group(1))
             
             # Add printable message
             result["message"] = f"type={result.get('type', 'unknown')} {result.get('msg', '')}"
@@ -1261,64 +2547,130 @@ class LogOperations:
         if timestamp is None:
             return True  # Include entries without timestamps
         
-        now = time.time()
+        start_time, end_time = self._resolve_time_bounds(since, until)
         
-        # Parse "since" parameter
-        if since:
-            start_time = None
-            
-            # Parse relative time specs
-            if since.endswith("m"):
-                minutes = int(since[:-1])
-                start_time = now - minutes * 60
-            elif since.endswith("h"):
-                hours = int(since[:-1])
-                start_time = now - hours * 60 * 60
-            elif since.endswith("d"):
-                days = int(since[:-1])
-                start_time = now - days * 24 * 60 * 60
-            else:
-                # Try to parse as absolute time
-                try:
-                    start_time = time.mktime(time.strptime(since, "%Y-%m-%d"))
-                except ValueError:
-                    try:
-                        start_time = time.mktime(time.strptime(since, "%Y-%m-%d %H:%M:%S"))
-                    except ValueError:
-                        pass
-            
-            if start_time and timestamp < start_time:
-                return False
+        if start_time and timestamp < start_time:
+            return False
         
-        # Parse "until" parameter
-        if until:
-            end_time = None
-            
-            # Parse relative time specs
-            if until.endswith("m"):
-                minutes = int(until[:-1])
-                end_time = now - minutes * 60
-            elif until.endswith("h"):
-                hours = int(until[:-1])
-                end_time = now - hours * 60 * 60
-            elif until.endswith("d"):
-                days = int(until[:-1])
-                end_time = now - days * 24 * 60 * 60
-            else:
-                # Try to parse as absolute time
-                try:
-                    end_time = time.mktime(time.strptime(until, "%Y-%m-%d"))
-                except ValueError:
-                    try:
-                        end_time = time.mktime(time.strptime(until, "%Y-%m-%d %H:%M:%S"))
-                    except ValueError:
-                        pass
-            
-            if end_time and timestamp > end_time:
-                return False
+        if end_time and timestamp > end_time:
+            return False
         
         return True
     
+    def _resolve_time_bounds(self,
+                             since: Optional[str],
+                             until: Optional[str]) -> Tuple[Optional[float], Optional[float]]:
+        """Resolve since/until time specifications to epoch timestamps.
+        
+        Args:
+            since: Time to start from
+            until: Time to end at
+        
+        Returns:
+            Tuple of start and end timestamps, None where not specified or not parseable
+        """
+        now = time.time()
+        return self._parse_time_spec(since, now), self._parse_time_spec(until, now)
+    
+    def _parse_time_spec(self, spec: Optional[str], now: float) -> Optional[float]:
+        """Parse a relative ("30m", "2h", "1d") or absolute time specification.
+        
+        Args:
+            spec: Time specification
+            now: Current timestamp that relative specifications count back from
+        
+        Returns:
+            Timestamp or None if not specified or not parseable
+        """
+        if not spec:
+            return None
+        
+        # Parse relative time specs
+        if spec.endswith("m"):
+            return now - int(spec[:-1]) * 60
+        elif spec.endswith("h"):
+            return now - int(spec[:-1]) * 60 * 60
+        elif spec.endswith("d"):
+            return now - int(spec[:-1]) * 24 * 60 * 60
+        
+        # Try to parse as absolute time
+        for fmt in ("%Y-%m-%d", "%Y-%m-%d %H:%M:%S"):
+            try:
+                return time.mktime(time.strptime(spec, fmt))
+            except ValueError:
+                pass
+        return None
+    
+    def _get_extractors(self, source: str) -> Tuple[Callable[[Dict[str, Any]], str],
+                                                   Callable[[Dict[str, Any]], str]]:
+        """Get the priority and message extractors for entries of a log source.
+        
+        Args:
+            source: Log source the entries came from
+        
+        Returns:
+            Tuple of priority and message extractor functions
+        """
+        if source == "journal":
+            return self._extract_journal_priority, self._extract_journal_message
+        return self._extract_parsed_priority, self._extract_parsed_message
+    
+    def _extract_journal_priority(self, entry: Dict[str, Any]) -> str:
+        """Extract priority from a journal entry.
+        
+        Args:
+            entry: Journal log entry
+        
+        Returns:
+            Priority string
+        """
+        priority = entry.get("PRIORITY")
+        if priority is None:
+            return self._extract_priority(entry)
+        return _JOURNAL_PRIORITIES.get(priority, "info")
+    
+    def _extract_journal_message(self, entry: Dict[str, Any]) -> str:
+        """Extract message from a journal entry.
+        
+        Args:
+            entry: Journal log entry
+        
+        Returns:
+            Message string
+        """
+        message = entry.get("MESSAGE")
+        if message is None:
+            return self._extract_message(entry)
+        return message
+    
+    def _extract_parsed_priority(self, entry: Dict[str, Any]) -> str:
+        """Extract priority from an entry parsed from a log file or dmesg.
+        
+        Args:
+            entry: Parsed log entry
+        
+        Returns:
+            Priority string
+        """
+        priority = entry.get("priority")
+        if priority is None:
+            return self._extract_priority(entry)
+        return priority
+    
+    def _extract_parsed_message(self, entry: Dict[str, Any]) -> str:
+        """Extract message from an entry parsed from a log file or dmesg.
+        
+        Args:
+            entry: Parsed log entry
+        
+        Returns:
+            Message string
+        """
+        message = entry.get("message")
+        if message is None:
+            return self._extract_message(entry)
+        return message
+    
     def _extract_priority(self, entry: Dict[str, Any]) -> str:
         """Extract priority from a log entry.
         
@@ -1329,41 +2681,17 @@ class LogOperations:
             Priority string
         """
         # Check direct priority field
-        if "priority" in entry:
-            return entry["priority"]
+        priority = entry.get("priority")
+        if priority is not None:
+            return priority
         
         # Check journald priority
-        if "PRIORITY" in entry:
-            priority_map = {
-                "0": "emerg",
-                "1": "alert",
-                "2": "crit",
-                "3": "err",
-                "4": "warning",
-                "5": "notice",
-                "6": "info",
-                "7": "debug"
-            }
-            return priority_map.get(entry["PRIORITY"], "info")
+        priority = entry.get("PRIORITY")
+        if priority is not None:
+            return _JOURNAL_PRIORITIES.get(priority, "info")
         
         # Try to guess from message
-        message = self._extract_message(entry).lower()
-        if "emergency" in message or "emerg" in message:
-            return "emerg"
-        elif "alert" in message:
-            return "alert"
-        elif "critical" in message or "crit" in message:
-            return "crit"
-        elif "error" in message or "err" in message:
-            return "err"
-        elif "warning" in message or "warn" in message:
-            return "warning"
-        elif "notice" in message:
-            return "notice"
-        elif "debug" in message:
-            return "debug"
-        else:
-            return "info"
+        return _guess_priority(_PRIO_RE, self._extract_message(entry))
     
     def _extract_message(self, entry: Dict[str, Any]) -> str:
         """Extract message from a log entry.
@@ -1374,15 +2702,13 @@ class LogOperations:
         Returns:
             Message string
         """
-        if "message" in entry:
-            return entry["message"]
-        elif "MESSAGE" in entry:
-            return entry["MESSAGE"]
-        elif "raw" in entry:
-            return entry["raw"]
-        else:
-            # Try to serialize the entire entry as string
-            return str(entry)
+        for key in ("message", "MESSAGE", "raw"):
+            message = entry.get(key)
+            if message is not None:
+                return message
+        
+        # Try to serialize the entire entry as string
+        return str(entry)
     
     def _extract_timestamp(self, entry: Dict[str, Any]) -> Optional[float]:
         """Extract timestamp from a log entry.
@@ -1393,33 +2719,21 @@ class LogOperations:
         Returns:
             Timestamp or None if not available
         """
-        if "timestamp" in entry:
-            return entry["timestamp"]
-        elif "__REALTIME_TIMESTAMP" in entry:
+        timestamp = entry.get("timestamp")
+        if timestamp is not None:
+            return timestamp
+        
+        realtime = entry.get("__REALTIME_TIMESTAMP")
+        if realtime is not None:
             try:
                 # Convert microseconds to seconds
-                return int(entry["__REALTIME_TIMESTAMP"]) / 1000000
+                return int(realtime) / 1000000
             except (ValueError, TypeError):
-                pass
-        elif "SYSLOG_TIMESTAMP" in entry:
-            try:
-                dt = datetime.strptime(entry["SYSLOG_TIMESTAMP"], "%b %d %H:%M:%S")
-                dt = dt.replace(year=datetime.now().year)
-                return dt.timestamp()
-            except ValueError:
-                pass
-        return None
-    
-    def _extract_day(self, entry: Dict[str, Any]) -> Optional[str]:
-        """Extract day from a log entry.
+                return None
         
-        Args:
-            entry: Log entry
-        
-        Returns:
-            Day string in YYYY-MM-DD format or None if not available
-        """
-        timestamp = self._extract_timestamp(entry)
-        if timestamp:
-            return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d")
+        syslog_timestamp = entry.get("SYSLOG_TIMESTAMP")
+        if syslog_timestamp is not None:
+            parts = syslog_timestamp.split()
+            if len(parts) == 3:
+                return _parse_syslog_ts(*parts)
         return None
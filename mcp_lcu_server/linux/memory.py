@@ -10,26 +10,137 @@
 # LICENSE file in the root directory of this source tree.
 
 import os
-import re
+import ctypes
+import functools
+import time
 import logging
-import subprocess
-from typing import Dict, List, Optional, Union, Any, Tuple
+import threading
+from collections import namedtuple
+from typing import Callable, Dict, List, Optional, Any, Tuple
 
 import psutil
 
 logger = logging.getLogger(__name__)
 
+# /proc/meminfo fields reported by get_memory_info, keyed by their raw name
+_MEMINFO_FIELDS = {name.encode(): name.lower() for name in (
+    "MemTotal", "MemFree", "MemAvailable", "Buffers", "Cached", "SwapCached",
+    "Active", "Inactive", "ActiveAnon", "InactiveAnon", "ActiveFile",
+    "InactiveFile", "Unevictable", "Mlocked", "SwapTotal", "SwapFree", "Dirty",
+    "Writeback", "AnonPages", "Mapped", "Shmem", "Slab", "SReclaimable",
+    "SUnreclaim", "KernelStack", "PageTables", "NFS_Unstable", "Bounce",
+    "WritebackTmp", "CommitLimit", "Committed_AS", "VmallocTotal",
+    "VmallocUsed", "VmallocChunk", "HardwareCorrupted", "AnonHugePages",
+    "ShmemHugePages", "ShmemPmdMapped", "CmaTotal", "CmaFree",
+    "HugePages_Total", "HugePages_Free", "HugePages_Rsvd", "HugePages_Surp",
+    "Hugepagesize", "DirectMap4k", "DirectMap2M", "DirectMap1G"
+)}
+
+# /proc/meminfo fields get_memory_usage is computed from
+_USAGE_FIELDS = frozenset({b"MemTotal", b"MemFree", b"MemAvailable"})
+
+# Virtual memory summary computed from /proc/meminfo, with the fields of psutil's
+_VirtualMemory = namedtuple(
+    "_VirtualMemory",
+    ["total", "available", "used", "free", "percent", "buffers", "cached", "shared"]
+)
+
+# struct sysinfo of sysinfo(2); the *ram and *swap sizes are in mem_unit bytes
+class _Sysinfo(ctypes.Structure):
+    _fields_ = [
+        ("uptime", ctypes.c_long),
+        ("loads", ctypes.c_ulong * 3),
+        ("totalram", ctypes.c_ulong),
+        ("freeram", ctypes.c_ulong),
+        ("sharedram", ctypes.c_ulong),
+        ("bufferram", ctypes.c_ulong),
+        ("totalswap", ctypes.c_ulong),
+        ("freeswap", ctypes.c_ulong),
+        ("procs", ctypes.c_ushort),
+        ("pad", ctypes.c_ushort),
+        ("totalhigh", ctypes.c_ulong),
+        ("freehigh", ctypes.c_ulong),
+        ("mem_unit", ctypes.c_uint),
+        ("_f", ctypes.c_char * max(
+            0, 20 - 2 * ctypes.sizeof(ctypes.c_long) - ctypes.sizeof(ctypes.c_int)
+        )),
+    ]
+
+
+# C library providing sysinfo(2), if it can be loaded
+try:
+    _libc = ctypes.CDLL("libc.so.6", use_errno=True)
+    _libc.sysinfo.argtypes = [ctypes.POINTER(_Sysinfo)]
+except (OSError, AttributeError):
+    _libc = None
+
+# Seconds a memory snapshot is reused for, to collapse bursts of polling
+_SNAPSHOT_TTL = 0.2
+
+# Units of human readable sizes, each 1024 times the previous one
+_UNITS = ("B", "KB", "MB", "GB", "TB", "PB", "EB")
+
+# /proc/meminfo fields that stay fixed, or effectively so, until the next boot
+_BOOT_FIELDS = frozenset({
+    b"MemTotal", b"VmallocTotal", b"Hugepagesize",
+    b"DirectMap4k", b"DirectMap2M", b"DirectMap1G"
+})
+
+# /proc/meminfo fields that are read on every call
+_MEMINFO_VOLATILE = {key: name for key, name in _MEMINFO_FIELDS.items() if key not in _BOOT_FIELDS}
+
+# Memory and swap summary fields reported by get_memory_stats
+_MEMORY_STATS_FIELDS = ("total", "available", "used", "free", "percent", "buffers", "cached", "shared")
+_SWAP_STATS_FIELDS = ("total", "used", "free", "percent", "sin", "sout")
+
+# Hugepages information keys to the /proc/meminfo fields they come from
+_HUGEPAGES_FIELDS = {
+    "total": "hugepages_total",
+    "free": "hugepages_free",
+    "reserved": "hugepages_rsvd",
+    "surplus": "hugepages_surp",
+    "size": "hugepagesize",
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _bytes_to_human(bytes_value: int) -> str:
+    """Convert bytes to human readable format; cached since sizes repeat across polls.
+    
+    Args:
+        bytes_value: Bytes value
+    
+    Returns:
+        Human readable string
+    """
+    if bytes_value < 1024:
+        return f"{bytes_value:.2f} B"
+    
+    # Each unit spans 10 bits, so the bit length picks the unit directly
+    idx = min((int(bytes_value).bit_length() - 1) // 10, len(_UNITS) - 1)
+    return f"{bytes_value / (1 << (idx * 10)):.2f} {_UNITS[idx]}"
+
 
 class MemoryOperations:
     """Class for memory operations on Linux systems."""
     
-    def __init__(self):
-        """Initialize memory operations."""
-        pass
+    def __init__(self, cache_ttl: float = _SNAPSHOT_TTL):
+        """Initialize memory operations.
+        
+        Args:
+            cache_ttl: Seconds a memory snapshot is reused for, 0 to disable
+        """
+        self._cache_ttl = cache_ttl
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        self._meminfo_boot = None
     
-    def get_memory_info(self) -> Dict[str, Any]:
+    def get_memory_info(self, human: bool = True) -> Dict[str, Any]:
         """Get detailed memory information.
         
+        Args:
+            human: Also include human readable *_human forms of the sizes
+        
         Returns:
             Dictionary with memory information including:
             - total: Total physical memory
@@ -42,8 +153,11 @@ class MemoryOperations:
             - shared: Shared memory
         """
         try:
-            # Get memory info from psutil
-            vm = psutil.virtual_memory()
+            # Get the memory summary and details from one /proc/meminfo read
+            vm, proc_info = self._cached("snapshot", self._snapshot)
+            buffers = getattr(vm, "buffers", 0)
+            cached = getattr(vm, "cached", 0)
+            shared = getattr(vm, "shared", 0)
             
             info = {
                 "total": vm.total,
@@ -51,25 +165,26 @@ class MemoryOperations:
                 "used": vm.used,
                 "free": vm.free,
                 "percent": vm.percent,
-                "buffers": getattr(vm, "buffers", 0),
-                "cached": getattr(vm, "cached", 0),
-                "shared": getattr(vm, "shared", 0),
+                "buffers": buffers,
+                "cached": cached,
+                "shared": shared,
             }
             
             # Convert to human readable format
-            info["total_human"] = self._bytes_to_human(vm.total)
-            info["available_human"] = self._bytes_to_human(vm.available)
-            info["used_human"] = self._bytes_to_human(vm.used)
-            info["free_human"] = self._bytes_to_human(vm.free)
-            info["buffers_human"] = self._bytes_to_human(getattr(vm, "buffers", 0))
-            info["cached_human"] = self._bytes_to_human(getattr(vm, "cached", 0))
-            info["shared_human"] = self._bytes_to_human(getattr(vm, "shared", 0))
-            
-            # Get memory info from /proc/meminfo for additional details
-            proc_info = self._get_memory_info_from_proc()
+            if human:
+                info["total_human"] = _bytes_to_human(vm.total)
+                info["available_human"] = _bytes_to_human(vm.available)
+                info["used_human"] = _bytes_to_human(vm.used)
+                info["free_human"] = _bytes_to_human(vm.free)
+                info["buffers_human"] = _bytes_to_human(buffers)
+                info["cached_human"] = _bytes_to_human(cached)
+                info["shared_human"] = _bytes_to_human(shared)
+            
+            # Add the /proc/meminfo fields for additional details
             if proc_info:
-                # Merge info from /proc/meminfo
-                info.update(proc_info)
+                # Merge info from /proc/meminfo, keeping the summary fields
+                # consistent with their human readable forms
+                info.update((key, value) for key, value in proc_info.items() if key not in info)
             
             return info
         except Exception as e:
@@ -97,20 +212,20 @@ class MemoryOperations:
             - percent: Percentage of memory used
         """
         try:
-            # Get memory info from psutil
-            vm = psutil.virtual_memory()
+            # Get the usage from the head of /proc/meminfo only
+            total, used, free, percent = self._cached("usage", self._read_memory_usage)
             
             usage = {
-                "total": vm.total,
-                "used": vm.used,
-                "free": vm.free,
-                "percent": vm.percent
+                "total": total,
+                "used": used,
+                "free": free,
+                "percent": percent
             }
             
             # Convert to human readable format
-            usage["total_human"] = self._bytes_to_human(vm.total)
-            usage["used_human"] = self._bytes_to_human(vm.used)
-            usage["free_human"] = self._bytes_to_human(vm.free)
+            usage["total_human"] = _bytes_to_human(total)
+            usage["used_human"] = _bytes_to_human(used)
+            usage["free_human"] = _bytes_to_human(free)
             
             return usage
         except Exception as e:
@@ -123,9 +238,12 @@ class MemoryOperations:
                 "percent": 0
             }
     
-    def get_swap_info(self) -> Dict[str, Any]:
+    def get_swap_info(self, human: bool = True) -> Dict[str, Any]:
         """Get detailed swap information.
         
+        Args:
+            human: Also include human readable *_human forms of the sizes
+        
         Returns:
             Dictionary with swap information:
             - total: Total swap memory
@@ -137,26 +255,21 @@ class MemoryOperations:
         """
         try:
             # Get swap info from psutil
-            swap = psutil.swap_memory()
+            swap = self._cached("swap", psutil.swap_memory)
             
-            info = {
-                "total": swap.total,
-                "used": swap.used,
-                "free": swap.free,
-                "percent": swap.percent,
-                "sin": swap.sin,
-                "sout": swap.sout
-            }
+            # The swap tuple holds exactly total, used, free, percent, sin and sout
+            info = swap._asdict()
             
             # Convert to human readable format
-            info["total_human"] = self._bytes_to_human(swap.total)
-            info["used_human"] = self._bytes_to_human(swap.used)
-            info["free_human"] = self._bytes_to_human(swap.free)
-            info["sin_human"] = self._bytes_to_human(swap.sin)
-            info["sout_human"] = self._bytes_to_human(swap.sout)
+            if human:
+                info["total_human"] = _bytes_to_human(swap.total)
+                info["used_human"] = _bytes_to_human(swap.used)
+                info["free_human"] = _bytes_to_human(swap.free)
+                info["sin_human"] = _bytes_to_human(swap.sin)
+                info["sout_human"] = _bytes_to_human(swap.sout)
             
             # Get swap info from /proc/swaps for additional details
-            proc_info = self._get_swap_info_from_proc()
+            proc_info = self._get_swap_info_from_proc(human)
             if proc_info:
                 # Include swap devices information
                 info["devices"] = proc_info
@@ -185,20 +298,28 @@ class MemoryOperations:
             - percent: Percentage of swap used
         """
         try:
-            # Get swap info from psutil
-            swap = psutil.swap_memory()
+            # Get swap totals from a single sysinfo(2) call where available
+            si = self._cached("sysinfo", self._sysinfo)
+            if si is not None:
+                total = si.totalswap * si.mem_unit
+                free = si.freeswap * si.mem_unit
+                used = total - free
+                percent = round(used / total * 100, 1) if total else 0.0
+            else:
+                swap = self._cached("swap", psutil.swap_memory)
+                total, used, free, percent = swap.total, swap.used, swap.free, swap.percent
             
             usage = {
-                "total": swap.total,
-                "used": swap.used,
-                "free": swap.free,
-                "percent": swap.percent
+                "total": total,
+                "used": used,
+                "free": free,
+                "percent": percent
             }
             
             # Convert to human readable format
-            usage["total_human"] = self._bytes_to_human(swap.total)
-            usage["used_human"] = self._bytes_to_human(swap.used)
-            usage["free_human"] = self._bytes_to_human(swap.free)
+            usage["total_human"] = _bytes_to_human(total)
+            usage["used_human"] = _bytes_to_human(used)
+            usage["free_human"] = _bytes_to_human(free)
             
             return usage
         except Exception as e:
@@ -211,9 +332,12 @@ class MemoryOperations:
                 "percent": 0
             }
     
-    def get_memory_stats(self) -> Dict[str, Any]:
+    def get_memory_stats(self, human: bool = True) -> Dict[str, Any]:
         """Get comprehensive memory statistics.
         
+        Args:
+            human: Also include human readable *_human forms of the sizes
+        
         Returns:
             Dictionary with memory statistics:
             - memory: Memory usage information
@@ -222,61 +346,45 @@ class MemoryOperations:
             - memory_distribution: Memory distribution
         """
         try:
-            memory_info = self.get_memory_info()
-            swap_info = self.get_swap_info()
+            memory_info = self.get_memory_info(human)
+            swap_info = self.get_swap_info(human)
+            
+            memory = {key: memory_info.get(key, 0) for key in _MEMORY_STATS_FIELDS}
             
             # Calculate memory distribution
-            memory_total = memory_info.get("total", 0)
+            memory_total = memory["total"]
             memory_distribution = {}
             
             if memory_total > 0:
-                memory_distribution["used"] = (memory_info.get("used", 0) / memory_total) * 100
-                memory_distribution["free"] = (memory_info.get("free", 0) / memory_total) * 100
-                memory_distribution["buffers"] = (memory_info.get("buffers", 0) / memory_total) * 100
-                memory_distribution["cached"] = (memory_info.get("cached", 0) / memory_total) * 100
-                memory_distribution["shared"] = (memory_info.get("shared", 0) / memory_total) * 100
-            
-            # Get hugepages information
-            hugepages = self._get_hugepages_info()
-            
-            # Create comprehensive stats
+                scale = 100.0 / memory_total
+                memory_distribution = {
+                    key: memory[key] * scale
+                    for key in ("used", "free", "buffers", "cached", "shared")
+                }
+            
+            # Get hugepages information from the /proc/meminfo fields already
+            # merged into the memory info
+            hugepages = self._get_hugepages_info(
+                memory_info if "hugepagesize" in memory_info else None, human
+            )
+            
+            # Create comprehensive stats, reusing the summaries as they are
             stats = {
-                "memory": {
-                    "total": memory_info.get("total", 0),
-                    "available": memory_info.get("available", 0),
-                    "used": memory_info.get("used", 0),
-                    "free": memory_info.get("free", 0),
-                    "percent": memory_info.get("percent", 0),
-                    "buffers": memory_info.get("buffers", 0),
-                    "cached": memory_info.get("cached", 0),
-                    "shared": memory_info.get("shared", 0),
-                },
-                "swap": {
-                    "total": swap_info.get("total", 0),
-                    "used": swap_info.get("used", 0),
-                    "free": swap_info.get("free", 0),
-                    "percent": swap_info.get("percent", 0),
-                    "sin": swap_info.get("sin", 0),
-                    "sout": swap_info.get("sout", 0),
-                },
+                "memory": memory,
+                "swap": {key: swap_info.get(key, 0) for key in _SWAP_STATS_FIELDS},
                 "hugepages": hugepages,
                 "memory_distribution": memory_distribution
             }
             
-            # Add human readable formats
-            stats["memory"]["total_human"] = self._bytes_to_human(memory_info.get("total", 0))
-            stats["memory"]["available_human"] = self._bytes_to_human(memory_info.get("available", 0))
-            stats["memory"]["used_human"] = self._bytes_to_human(memory_info.get("used", 0))
-            stats["memory"]["free_human"] = self._bytes_to_human(memory_info.get("free", 0))
-            stats["memory"]["buffers_human"] = self._bytes_to_human(memory_info.get("buffers", 0))
-            stats["memory"]["cached_human"] = self._bytes_to_human(memory_info.get("cached", 0))
-            stats["memory"]["shared_human"] = self._bytes_to_human(memory_info.get("shared", 0))
-            
-            stats["swap"]["total_human"] = self._bytes_to_human(swap_info.get("total", 0))
-            stats["swap"]["used_human"] = self._bytes_to_human(swap_info.get("used", 0))
-            stats["swap"]["free_human"] = self._bytes_to_human(swap_info.get("free", 0))
-            stats["swap"]["sin_human"] = self._bytes_to_human(swap_info.get("sin", 0))
-            stats["swap"]["sout_human"] = self._bytes_to_human(swap_info.get("sout", 0))
+            # Add the human readable formats computed with the summaries
+            if human:
+                zero = _bytes_to_human(0)
+                for key in _MEMORY_STATS_FIELDS:
+                    if key != "percent":
+                        stats["memory"][key + "_human"] = memory_info.get(key + "_human", zero)
+                for key in _SWAP_STATS_FIELDS:
+                    if key != "percent":
+                        stats["swap"][key + "_human"] = swap_info.get(key + "_human", zero)
             
             return stats
         except Exception as e:
@@ -298,86 +406,163 @@ class MemoryOperations:
         Returns:
             Human readable string
         """
-        for unit in ["B", "KB", "MB", "GB", "TB", "PB"]:
-            if bytes_value < 1024.0:
-                return f"{bytes_value:.2f} {unit}"
-            bytes_value /= 1024.0
-        return f"{bytes_value:.2f} EB"
+        return _bytes_to_human(bytes_value)
+    
+    def _cached(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Return the result of fn cached under key, or compute and cache it.
+        
+        Bursts of calls then share one read of the underlying kernel data.
+        Cached results are shared and must not be modified.
+        
+        Args:
+            key: Cache key
+            fn: Function computing the result
+        
+        Returns:
+            Cached or freshly computed result
+        """
+        with self._cache_lock:
+            hit = self._cache.get(key)
+            if hit is not None and time.monotonic() - hit[0] < self._cache_ttl:
+                return hit[1]
+        
+        value = fn()
+        
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), value)
+        
+        return value
+    
+    def _sysinfo(self) -> Optional["_Sysinfo"]:
+        """Get the memory and swap totals of the sysinfo(2) system call.
+        
+        Returns:
+            Filled sysinfo structure, or None if the call is not available
+        """
+        if _libc is None:
+            return None
+        
+        si = _Sysinfo()
+        if _libc.sysinfo(ctypes.byref(si)) != 0:
+            logger.error(f"Error calling sysinfo: {os.strerror(ctypes.get_errno())}")
+            return None
+        return si
+    
+    def _read_memory_usage(self) -> Tuple[int, int, int, float]:
+        """Read the memory usage from the first lines of /proc/meminfo.
+        
+        MemTotal, MemFree and MemAvailable lead the file, so reading stops
+        after them. Used memory is total - available, consistent with
+        get_memory_info; psutil.virtual_memory() is only consulted when
+        MemAvailable is missing.
+        
+        Returns:
+            Tuple of total, used and free bytes and the percentage used
+        """
+        fields = {}
+        with open("/proc/meminfo", "rb") as f:
+            for line in f:
+                key, _, rest = line.partition(b":")
+                if key in _USAGE_FIELDS:
+                    fields[key] = int(rest.split()[0]) * 1024  # Convert from KB to bytes
+                    if len(fields) == len(_USAGE_FIELDS):
+                        break
+        
+        total = fields.get(b"MemTotal")
+        free = fields.get(b"MemFree")
+        available = fields.get(b"MemAvailable")
+        if not total or free is None or not available:
+            vm = psutil.virtual_memory()
+            return vm.total, vm.used, vm.free, vm.percent
+        
+        if available > total:
+            available = free
+        return total, total - available, free, round((total - available) / total * 100, 1)
+    
+    def _snapshot(self) -> Tuple[Any, Dict[str, Any]]:
+        """Read /proc/meminfo once for both the memory summary and its details.
+        
+        The summary has the fields of psutil.virtual_memory(), which is only
+        consulted when /proc/meminfo lacks the fields needed. Used memory is
+        always total - available, as recent psutil releases compute it; older
+        ones such as psutil 5.9.x report total - free - buffers - cached, so
+        with those the figure can differ from psutil's.
+        
+        Returns:
+            Tuple of the virtual memory summary and the parsed /proc/meminfo fields
+        """
+        proc_info = self._get_memory_info_from_proc() or {}
+        total = proc_info.get("memtotal")
+        free = proc_info.get("memfree")
+        available = proc_info.get("memavailable")
+        if not total or free is None or not available:
+            return psutil.virtual_memory(), proc_info
+        
+        if available > total:
+            available = free
+        vm = _VirtualMemory(
+            total=total,
+            available=available,
+            used=total - available,
+            free=free,
+            percent=round((total - available) / total * 100, 1),
+            buffers=proc_info.get("buffers", 0),
+            cached=proc_info.get("cached", 0) + proc_info.get("sreclaimable", 0),
+            shared=proc_info.get("shmem", 0),
+        )
+        return vm, proc_info
     
     def _get_memory_info_from_proc(self) -> Optional[Dict[str, Any]]:
-        """Get memory information from /proc/meminfo."""
+        """Get memory information from /proc/meminfo.
+        
+        Fields fixed for the boot are parsed on the first call only; later
+        calls reuse them and stop reading after the last other field.
+        """
         try:
-            with open("/proc/meminfo", "r") as f:
-                content = f.read()
+            boot = self._meminfo_boot
+            fields, last = (_MEMINFO_VOLATILE, boot[1]) if boot else (_MEMINFO_FIELDS, None)
             
-            # Parse memory info
+            # Parse memory info in a single pass over the "Key: value [kB]" lines
             info = {}
-            
-            # Define patterns for interesting values
-            patterns = {
-                "MemTotal": r"MemTotal:\s+(\d+)",
-                "MemFree": r"MemFree:\s+(\d+)",
-                "MemAvailable": r"MemAvailable:\s+(\d+)",
-                "Buffers": r"Buffers:\s+(\d+)",
-                "Cached": r"Cached:\s+(\d+)",
-                "SwapCached": r"SwapCached:\s+(\d+)",
-                "Active": r"Active:\s+(\d+)",
-                "Inactive": r"Inactive:\s+(\d+)",
-                "ActiveAnon": r"ActiveAnon:\s+(\d+)",
-                "InactiveAnon": r"InactiveAnon:\s+(\d+)",
-                "ActiveFile": r"ActiveFile:\s+(\d+)",
-                "InactiveFile": r"InactiveFile:\s+(\d+)",
-                "Unevictable": r"Unevictable:\s+(\d+)",
-                "Mlocked": r"Mlocked:\s+(\d+)",
-                "SwapTotal": r"SwapTotal:\s+(\d+)",
-                "SwapFree": r"SwapFree:\s+(\d+)",
-                "Dirty": r"Dirty:\s+(\d+)",
-                "Writeback": r"Writeback:\s+(\d+)",
-                "AnonPages": r"AnonPages:\s+(\d+)",
-                "Mapped": r"Mapped:\s+(\d+)",
-                "Shmem": r"Shmem:\s+(\d+)",
-                "Slab": r"Slab:\s+(\d+)",
-                "SReclaimable": r"SReclaimable:\s+(\d+)",
-                "SUnreclaim": r"SUnreclaim:\s+(\d+)",
-                "KernelStack": r"KernelStack:\s+(\d+)",
-                "PageTables": r"PageTables:\s+(\d+)",
-                "NFS_Unstable": r"NFS_Unstable:\s+(\d+)",
-                "Bounce": r"Bounce:\s+(\d+)",
-                "WritebackTmp": r"WritebackTmp:\s+(\d+)",
-                "CommitLimit": r"CommitLimit:\s+(\d+)",
-                "Committed_AS": r"Committed_AS:\s+(\d+)",
-                "VmallocTotal": r"VmallocTotal:\s+(\d+)",
-                "VmallocUsed": r"VmallocUsed:\s+(\d+)",
-                "VmallocChunk": r"VmallocChunk:\s+(\d+)",
-                "HardwareCorrupted": r"HardwareCorrupted:\s+(\d+)",
-                "AnonHugePages": r"AnonHugePages:\s+(\d+)",
-                "ShmemHugePages": r"ShmemHugePages:\s+(\d+)",
-                "ShmemPmdMapped": r"ShmemPmdMapped:\s+(\d+)",
-                "CmaTotal": r"CmaTotal:\s+(\d+)",
-                "CmaFree": r"CmaFree:\s+(\d+)",
-                "HugePages_Total": r"HugePages_Total:\s+(\d+)",
-                "HugePages_Free": r"HugePages_Free:\s+(\d+)",
-                "HugePages_Rsvd": r"HugePages_Rsvd:\s+(\d+)",
-                "HugePages_Surp": r"HugePages_Surp:\s+(\d+)",
-                "Hugepagesize": r"Hugepagesize:\s+(\d+)",
-                "DirectMap4k": r"DirectMap4k:\s+(\d+)",
-                "DirectMap2M": r"DirectMap2M:\s+(\d+)",
-                "DirectMap1G": r"DirectMap1G:\s+(\d+)",
-            }
-            
-            # Extract values
-            for key, pattern in patterns.items():
-                match = re.search(pattern, content)
-                if match:
-                    info[key.lower()] = int(match.group(1)) * 1024  # Convert from KB to bytes
+            with open("/proc/meminfo", "rb") as f:
+                for line in f:
+                    key, _, rest = line.partition(b":")
+                    name = fields.get(key)
+                    if name is not None:
+                        if rest.endswith(b" kB\n"):
+                            info[name] = int(rest[:-4]) * 1024  # Convert from KB to bytes
+                        else:
+                            info[name] = int(rest)
+                        if key == last:
+                            break
+            
+            if boot:
+                info.update(boot[0])
+            else:
+                # Remember the boot-invariant fields and the last field that
+                # still has to be read, all at once for concurrent callers;
+                # info holds the fields in file order
+                keys = {name: key for key, name in _MEMINFO_VOLATILE.items()}
+                self._meminfo_boot = (
+                    {name: info[name] for key, name in _MEMINFO_FIELDS.items()
+                     if key in _BOOT_FIELDS and name in info},
+                    next((keys[name] for name in reversed(info) if name in keys), None)
+                )
             
             return info
         except Exception as e:
             logger.error(f"Error getting memory info from /proc/meminfo: {e}")
             return None
     
-    def _get_swap_info_from_proc(self) -> Optional[List[Dict[str, Any]]]:
-        """Get swap information from /proc/swaps."""
+    def _get_swap_info_from_proc(self, human: bool = True) -> Optional[List[Dict[str, Any]]]:
+        """Get swap information from /proc/swaps.
+        
+        Args:
+            human: Also include human readable *_human forms of the sizes
+        
+        Returns:
+            List of swap devices, or None if there are none or on error
+        """
         try:
             with open("/proc/swaps", "r") as f:
                 content = f.readlines()
@@ -391,51 +576,52 @@ class MemoryOperations:
             # Parse each swap device
             for line in content[1:]:
                 parts = line.split()
-                if len(parts) >= 5:
-                    device = {
-                        "filename": parts[0],
-                        "type": parts[1],
-                        "size": int(parts[2]) * 1024,  # Convert from KB to bytes
-                        "used": int(parts[3]) * 1024,  # Convert from KB to bytes
-                        "priority": int(parts[4]),
-                        "size_human": self._bytes_to_human(int(parts[2]) * 1024),
-                        "used_human": self._bytes_to_human(int(parts[3]) * 1024),
-                    }
-                    swap_devices.append(device)
+                if len(parts) < 5:
+                    continue
+                
+                size = int(parts[2]) << 10  # Convert from KB to bytes
+                used = int(parts[3]) << 10  # Convert from KB to bytes
+                device = {
+                    "filename": parts[0],
+                    "type": parts[1],
+                    "size": size,
+                    "used": used,
+                    "priority": int(parts[4]),
+                }
+                if human:
+                    device["size_human"] = _bytes_to_human(size)
+                    device["used_human"] = _bytes_to_human(used)
+                swap_devices.append(device)
             
             return swap_devices
         except Exception as e:
             logger.error(f"Error getting swap info from /proc/swaps: {e}")
             return None
     
-    def _get_hugepages_info(self) -> Dict[str, Any]:
-        """Get hugepages information."""
+    def _get_hugepages_info(self,
+                            parsed: Optional[Dict[str, Any]] = None,
+                            human: bool = True) -> Dict[str, Any]:
+        """Get hugepages information.
+        
+        Args:
+            parsed: Already parsed /proc/meminfo fields, read again if not given
+            human: Also include human readable *_human forms of the sizes
+        
+        Returns:
+            Dictionary with hugepages information
+        """
         hugepages = {}
         
         try:
-            # Try to get hugepages information from /proc/meminfo
-            with open("/proc/meminfo", "r") as f:
-                content = f.read()
-            
-            # Extract hugepages information
-            patterns = {
-                "total": r"HugePages_Total:\s+(\d+)",
-                "free": r"HugePages_Free:\s+(\d+)",
-                "reserved": r"HugePages_Rsvd:\s+(\d+)",
-                "surplus": r"HugePages_Surp:\s+(\d+)",
-                "size": r"Hugepagesize:\s+(\d+)",
-            }
+            # Take hugepages information from /proc/meminfo
+            if parsed is None:
+                _, parsed = self._cached("snapshot", self._snapshot)
             
-            for key, pattern in patterns.items():
-                match = re.search(pattern, content)
-                if match:
-                    value = int(match.group(1))
-                    if key == "size":
-                        value *= 1024  # Convert from KB to bytes
-                        hugepages[key] = value
-                        hugepages["size_human"] = self._bytes_to_human(value)
-                    else:
-                        hugepages[key] = value
+            for key, field in _HUGEPAGES_FIELDS.items():
+                if field in parsed:
+                    hugepages[key] = parsed[field]
+            if human and "size" in hugepages:
+                hugepages["size_human"] = _bytes_to_human(hugepages["size"])
             
             # Calculate used hugepages
             if "total" in hugepages and "free" in hugepages:
@@ -445,7 +631,8 @@ class MemoryOperations:
             if "total" in hugepages and "size" in hugepages:
                 total_size = hugepages["total"] * hugepages["size"]
                 hugepages["total_size"] = total_size
-                hugepages["total_size_human"] = self._bytes_to_human(total_size)
+                if human:
+                    hugepages["total_size_human"] = _bytes_to_human(total_size)
             
             return hugepages
         except Exception as e:
@@ -14,19 +14,92 @@ import time
 import json
 import logging
 import socket
+import operator
 import threading
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Union, Any, Tuple, Callable
 
 import psutil
 
-from mcp_lcu_server.linux.cpu import CPUOperations
-from mcp_lcu_server.linux.memory import MemoryOperations
-from mcp_lcu_server.linux.process import ProcessOperations
-from mcp_lcu_server.linux.storage import StorageOperations
 from mcp_lcu_server.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Leading fields of psutil's disk I/O counters that the disk metrics report
+_DISK_IO_FIELDS = ("read_count", "write_count", "read_bytes", "write_bytes", "read_time", "write_time")
+
+# Partition fields kept in disk usage metrics; list_partitions sets all of
+# them whenever usage ("total") is available
+_DISK_FIELDS = ("device", "mountpoint", "fstype", "total", "used", "free", "percent")
+_disk_proj = operator.itemgetter(*_DISK_FIELDS)
+_disk_usage_proj = operator.itemgetter("mountpoint", "percent")
+
+# Positional fields of psutil's connection tuples (fd, family, type, laddr,
+# raddr, status, pid)
+_conn_family_type = operator.itemgetter(1, 2)
+_conn_status = operator.itemgetter(5)
+
+# Health checks: component, readings from the system status as (value,
+# message fields) pairs, critical and warning levels, and the messages
+_HEALTH_CHECKS = (
+    ("cpu",
+     lambda status: [(status.get("cpu", {}).get("usage_percent", 0), {})],
+     90, 75,
+     "High CPU usage ({value:.1f}%)",
+     "Elevated CPU usage ({value:.1f}%)"),
+    ("memory",
+     lambda status: [(status.get("memory", {}).get("percent", 0), {})],
+     90, 75,
+     "High memory usage ({value:.1f}%)",
+     "Elevated memory usage ({value:.1f}%)"),
+    ("disk",
+     lambda status: [
+         (disk.get("percent", 0), {"mountpoint": disk.get("mountpoint", "unknown")})
+         for disk in status.get("disks", [])
+     ],
+     90, 75,
+     "High disk usage on {mountpoint} ({value:.1f}%)",
+     "Elevated disk usage on {mountpoint} ({value:.1f}%)"),
+    ("load",
+     lambda status: [(status.get("cpu", {}).get("load_average", {}).get("1min_per_cpu", 0), {})],
+     3.0, 1.5,
+     "Very high system load (load per CPU: {value:.1f})",
+     "High system load (load per CPU: {value:.1f})"),
+)
+
+# Health status for the highest severity found
+_HEALTH_STATUS = {0: "Healthy", 2: "Warning", 3: "Critical"}
+
+# Seconds a system status computed on demand is served to later callers
+_STATUS_CACHE_TTL = 1.0
+
+# Unsigned 64-bit arithmetic for I/O counter deltas
+_UINT64_MASK = (1 << 64) - 1
+_UINT64_SIGN = 1 << 63
+
+# Worker threads running the monitoring callbacks, and the number of callbacks
+# that may be queued or running before new ones are dropped
+_CALLBACK_WORKERS = 2
+_MAX_PENDING_CALLBACKS = 32
+
+
+def _counter_delta(current: int, previous: int) -> int:
+    """Get the increase of a cumulative counter between two readings.
+    
+    A counter that went backwards (device reattached, counter reset or
+    wrapped) yields 0 rather than a negative delta.
+    
+    Args:
+        current: Current counter value
+        previous: Previous counter value
+    
+    Returns:
+        Counter increase
+    """
+    delta = (current - previous) & _UINT64_MASK
+    return delta if delta < _UINT64_SIGN else 0
+
 
 class MonitoringOperations:
     """Class for system monitoring on Linux systems."""
@@ -38,32 +111,84 @@ class MonitoringOperations:
             config: Server configuration
         """
         self.config = config
-        self.cpu_ops = CPUOperations()
-        self.memory_ops = MemoryOperations()
-        self.process_ops = ProcessOperations()
-        self.storage_ops = StorageOperations()
+        
+        # Operations, created on first use so that a server with monitoring
+        # disabled does not pay for them at startup
+        self._cpu_ops = None
+        self._memory_ops = None
+        self._process_ops = None
+        self._storage_ops = None
         
         # Monitoring state
         self.monitoring_enabled = config.monitoring.enabled
         self.monitoring_interval = config.monitoring.interval
+        self._enabled_metrics = frozenset(config.monitoring.metrics)
         self.monitoring_thread = None
         self.monitoring_lock = threading.Lock()
         self.stop_monitoring_flag = threading.Event()
         
-        # Callbacks for monitoring events
+        # Callbacks for monitoring events, run off the monitoring thread
         self.callbacks = {}
+        self._callback_executor = None
+        self._callback_slots = threading.BoundedSemaphore(_MAX_PENDING_CALLBACKS)
         
-        # Metrics store
+        # Maximum number of metrics to store (1 hour worth of data at default interval)
+        self.max_metrics = max(1, 3600 // self.monitoring_interval)
+        
+        # Metrics store, one ring buffer per metric type that drops the
+        # oldest metrics once full
         self.metrics_store = {
-            "cpu": [],
-            "memory": [],
-            "disk": [],
-            "network": [],
-            "system": []
+            metric_type: deque(maxlen=self.max_metrics)
+            for metric_type in ("cpu", "memory", "disk", "network", "system")
         }
         
-        # Maximum number of metrics to store (1 hour worth of data at default interval)
-        self.max_metrics = 3600 // self.monitoring_interval
+        # Process and connection counts, refreshed every slow_interval_ticks
+        # ticks since they walk /proc
+        self._process_count = None
+        self._connection_counts = None
+        
+        # Immutable copies of the ring buffers published after every append;
+        # rebinding a dict item is atomic, so readers need no lock
+        self._snapshots = {metric_type: () for metric_type in self.metrics_store}
+        
+        # Last system status with the monotonic time it expires at; set by
+        # every monitoring tick and by on-demand computations. The lock lets
+        # one caller recompute an expired status while the others wait for it
+        self._status_cache = (0.0, None)
+        self._status_ttl = _STATUS_CACHE_TTL
+        self._status_lock = threading.Lock()
+    
+    @property
+    def cpu_ops(self):
+        """CPU operations, created on first use."""
+        if self._cpu_ops is None:
+            from mcp_lcu_server.linux.cpu import CPUOperations
+            self._cpu_ops = CPUOperations()
+        return self._cpu_ops
+    
+    @property
+    def memory_ops(self):
+        """Memory operations, created on first use."""
+        if self._memory_ops is None:
+            from mcp_lcu_server.linux.memory import MemoryOperations
+            self._memory_ops = MemoryOperations()
+        return self._memory_ops
+    
+    @property
+    def process_ops(self):
+        """Process operations, created on first use."""
+        if self._process_ops is None:
+            from mcp_lcu_server.linux.process import ProcessOperations
+            self._process_ops = ProcessOperations()
+        return self._process_ops
+    
+    @property
+    def storage_ops(self):
+        """Storage operations, created on first use."""
+        if self._storage_ops is None:
+            from mcp_lcu_server.linux.storage import StorageOperations
+            self._storage_ops = StorageOperations()
+        return self._storage_ops
     
     def start_monitoring(self) -> bool:
         """Start system monitoring.
@@ -83,6 +208,12 @@ class MonitoringOperations:
             # Reset stop flag
             self.stop_monitoring_flag.clear()
             
+            # Start callback workers
+            self._callback_executor = ThreadPoolExecutor(
+                max_workers=_CALLBACK_WORKERS,
+                thread_name_prefix="monitoring-callback"
+            )
+            
             # Start monitoring thread
             self.monitoring_thread = threading.Thread(
                 target=self._monitoring_loop,
@@ -114,6 +245,10 @@ class MonitoringOperations:
                 logger.warning("Monitoring thread did not terminate gracefully")
                 return False
             
+            # Stop callback workers without waiting for running callbacks
+            self._callback_executor.shutdown(wait=False)
+            self._callback_executor = None
+            
             self.monitoring_thread = None
             logger.info("Stopped system monitoring")
             return True
@@ -133,29 +268,45 @@ class MonitoringOperations:
         Returns:
             Dictionary with monitoring status
         """
-        with self.monitoring_lock:
-            return {
-                "enabled": self.monitoring_enabled,
-                "running": self.is_monitoring_running(),
-                "interval": self.monitoring_interval,
-                "metrics": {metric: len(data) for metric, data in self.metrics_store.items()}
-            }
+        return {
+            "enabled": self.monitoring_enabled,
+            "running": self.is_monitoring_running(),
+            "interval": self.monitoring_interval,
+            "metrics": {metric: len(data) for metric, data in self._snapshots.items()}
+        }
     
-    def get_system_status(self) -> Dict[str, Any]:
+    def get_system_status(self, refresh: bool = False) -> Dict[str, Any]:
         """Get system status.
         
+        Args:
+            refresh: Whether to recompute the status even if the cached one
+                has not expired
+        
         Returns:
             Dictionary with system status
         """
         try:
-            # Collect current system metrics
-            metrics = self._collect_system_metrics()
-            
-            # Get previous metrics if available
-            prev_metrics = self.metrics_store["system"][-1] if self.metrics_store["system"] else None
+            # Serve the cached status while it is fresh
+            expires_at, status = self._status_cache
+            if not refresh and status is not None and time.monotonic() < expires_at:
+                return status
             
-            # Calculate system status from metrics
-            status = self._calculate_system_status(metrics, prev_metrics)
+            with self._status_lock:
+                # Another caller may have recomputed it while we waited
+                expires_at, status = self._status_cache
+                if not refresh and status is not None and time.monotonic() < expires_at:
+                    return status
+                
+                # Collect current system metrics
+                metrics = self._collect_system_metrics()
+                
+                # Get previous metrics if available
+                system_metrics = self._snapshots["system"]
+                prev_metrics = system_metrics[-1] if system_metrics else None
+                
+                # Calculate system status from metrics
+                status = self._calculate_system_status(metrics, prev_metrics)
+                self._status_cache = (time.monotonic() + self._status_ttl, status)
             
             return status
         except Exception as e:
@@ -171,10 +322,8 @@ class MonitoringOperations:
         Returns:
             List of CPU metrics
         """
-        with self.monitoring_lock:
-            # Get most recent metrics
-            metrics = self.metrics_store["cpu"][-count:] if self.metrics_store["cpu"] else []
-            return metrics
+        # Get most recent metrics
+        return self._recent_metrics("cpu", count)
     
     def get_memory_metrics(self, count: int = 60) -> List[Dict[str, Any]]:
         """Get memory metrics.
@@ -185,10 +334,8 @@ class MonitoringOperations:
         Returns:
             List of memory metrics
         """
-        with self.monitoring_lock:
-            # Get most recent metrics
-            metrics = self.metrics_store["memory"][-count:] if self.metrics_store["memory"] else []
-            return metrics
+        # Get most recent metrics
+        return self._recent_metrics("memory", count)
     
     def get_disk_metrics(self, count: int = 60) -> List[Dict[str, Any]]:
         """Get disk metrics.
@@ -199,10 +346,8 @@ class MonitoringOperations:
         Returns:
             List of disk metrics
         """
-        with self.monitoring_lock:
-            # Get most recent metrics
-            metrics = self.metrics_store["disk"][-count:] if self.metrics_store["disk"] else []
-            return metrics
+        # Get most recent metrics
+        return self._recent_metrics("disk", count)
     
     def get_network_metrics(self, count: int = 60) -> List[Dict[str, Any]]:
         """Get network metrics.
@@ -213,10 +358,8 @@ class MonitoringOperations:
         Returns:
             List of network metrics
         """
-        with self.monitoring_lock:
-            # Get most recent metrics
-            metrics = self.metrics_store["network"][-count:] if self.metrics_store["network"] else []
-            return metrics
+        # Get most recent metrics
+        return self._recent_metrics("network", count)
     
     def get_system_metrics(self, count: int = 60) -> List[Dict[str, Any]]:
         """Get system metrics.
@@ -227,10 +370,8 @@ class MonitoringOperations:
         Returns:
             List of system metrics
         """
-        with self.monitoring_lock:
-            # Get most recent metrics
-            metrics = self.metrics_store["system"][-count:] if self.metrics_store["system"] else []
-            return metrics
+        # Get most recent metrics
+        return self._recent_metrics("system", count)
     
     def register_callback(self, event_type: str, callback: Callable[[Dict[str, Any]], None]) -> None:
         """Register a callback for monitoring events.
@@ -258,108 +399,42 @@ class MonitoringOperations:
             system_metrics = self.get_system_metrics(60)  # Last hour
             
             # Determine health status
-            health_status = "Healthy"
             severity = 0
             issues = []
             
-            # Check CPU usage
-            cpu_usage = status.get("cpu", {}).get("usage_percent", 0)
-            if cpu_usage > 90:
-                health_status = "Critical"
-                severity = 3
-                issues.append({
-                    "component": "cpu",
-                    "severity": "critical",
-                    "message": f"High CPU usage ({cpu_usage:.1f}%)"
-                })
-            elif cpu_usage > 75:
-                if severity < 2:
-                    health_status = "Warning"
-                    severity = 2
-                issues.append({
-                    "component": "cpu",
-                    "severity": "warning",
-                    "message": f"Elevated CPU usage ({cpu_usage:.1f}%)"
-                })
-            
-            # Check memory usage
-            memory_usage = status.get("memory", {}).get("percent", 0)
-            if memory_usage > 90:
-                health_status = "Critical"
-                severity = 3
-                issues.append({
-                    "component": "memory",
-                    "severity": "critical",
-                    "message": f"High memory usage ({memory_usage:.1f}%)"
-                })
-            elif memory_usage > 75:
-                if severity < 2:
-                    health_status = "Warning"
-                    severity = 2
-                issues.append({
-                    "component": "memory",
-                    "severity": "warning",
-                    "message": f"Elevated memory usage ({memory_usage:.1f}%)"
-                })
+            for component, readings, critical_level, warning_level, critical_msg, warning_msg in _HEALTH_CHECKS:
+                for value, fields in readings(status):
+                    if value > critical_level:
+                        severity = 3
+                        issues.append({
+                            "component": component,
+                            "severity": "critical",
+                            "message": critical_msg.format(value=value, **fields)
+                        })
+                    elif value > warning_level:
+                        severity = max(severity, 2)
+                        issues.append({
+                            "component": component,
+                            "severity": "warning",
+                            "message": warning_msg.format(value=value, **fields)
+                        })
             
-            # Check disk usage
-            for disk in status.get("disks", []):
-                usage = disk.get("percent", 0)
-                mountpoint = disk.get("mountpoint", "unknown")
-                
-                if usage > 90:
-                    health_status = "Critical"
-                    severity = 3
-                    issues.append({
-                        "component": "disk",
-                        "severity": "critical",
-                        "message": f"High disk usage on {mountpoint} ({usage:.1f}%)"
-                    })
-                elif usage > 75:
-                    if severity < 2:
-                        health_status = "Warning"
-                        severity = 2
-                    issues.append({
-                        "component": "disk",
-                        "severity": "warning",
-                        "message": f"Elevated disk usage on {mountpoint} ({usage:.1f}%)"
-                    })
-            
-            # Check system load
-            load_avg = status.get("cpu", {}).get("load_average", {})
-            load_1min = load_avg.get("1min_per_cpu", 0)
-            
-            if load_1min > 3.0:
-                health_status = "Critical"
-                severity = 3
-                issues.append({
-                    "component": "load",
-                    "severity": "critical",
-                    "message": f"Very high system load (load per CPU: {load_1min:.1f})"
-                })
-            elif load_1min > 1.5:
-                if severity < 2:
-                    health_status = "Warning"
-                    severity = 2
-                issues.append({
-                    "component": "load",
-                    "severity": "warning",
-                    "message": f"High system load (load per CPU: {load_1min:.1f})"
-                })
+            health_status = _HEALTH_STATUS[severity]
             
             # Generate recommendations
             recommendations = []
+            critical = {issue["component"] for issue in issues if issue["severity"] == "critical"}
             
-            if any(issue["component"] == "cpu" and issue["severity"] == "critical" for issue in issues):
+            if "cpu" in critical:
                 recommendations.append("Identify and terminate CPU-intensive processes")
             
-            if any(issue["component"] == "memory" and issue["severity"] == "critical" for issue in issues):
+            if "memory" in critical:
                 recommendations.append("Check for memory leaks or increase system memory")
             
-            if any(issue["component"] == "disk" and issue["severity"] == "critical" for issue in issues):
+            if "disk" in critical:
                 recommendations.append("Free up disk space by removing unnecessary files")
             
-            if any(issue["component"] == "load" and issue["severity"] == "critical" for issue in issues):
+            if "load" in critical:
                 recommendations.append("Reduce system load by terminating unnecessary processes")
             
             # Create health check report
@@ -380,61 +455,76 @@ class MonitoringOperations:
         """Main monitoring loop."""
         prev_net_counters = None
         prev_disk_counters = None
-        prev_time = time.time()
+        prev_time = time.monotonic()
+        tick = 0
         
-        while not self.stop_monitoring_flag.is_set():
+        # Settings consulted every tick
+        enabled_metrics = self._enabled_metrics
+        slow_interval_ticks = self.config.monitoring.slow_interval_ticks
+        
+        while True:
             try:
-                # Get current time
-                current_time = time.time()
+                # Get current time; monotonic, so clock adjustments cannot
+                # make the elapsed time (and the rates) negative
+                current_time = time.monotonic()
                 elapsed_time = current_time - prev_time
                 
+                # Refresh the expensive counts only every few ticks
+                refresh_slow = tick % slow_interval_ticks == 0
+                tick += 1
+                
+                # Take the readings shared by several collectors once per tick
+                snapshot = self._take_snapshot(refresh_slow)
+                
                 # Collect CPU metrics
-                if "cpu" in self.config.monitoring.metrics:
-                    cpu_metrics = self._collect_cpu_metrics()
+                if "cpu" in enabled_metrics:
+                    cpu_metrics = self._collect_cpu_metrics(snapshot)
                     self._add_metrics("cpu", cpu_metrics)
                     self._trigger_callbacks("cpu", cpu_metrics)
                 
                 # Collect memory metrics
-                if "memory" in self.config.monitoring.metrics:
-                    memory_metrics = self._collect_memory_metrics()
+                if "memory" in enabled_metrics:
+                    memory_metrics = self._collect_memory_metrics(snapshot)
                     self._add_metrics("memory", memory_metrics)
                     self._trigger_callbacks("memory", memory_metrics)
                 
                 # Collect disk metrics
-                if "disk" in self.config.monitoring.metrics:
-                    disk_metrics = self._collect_disk_metrics(prev_disk_counters, elapsed_time)
+                if "disk" in enabled_metrics:
+                    # The counters read are kept as the previous ones
+                    disk_metrics, prev_disk_counters = self._collect_disk_metrics(
+                        prev_disk_counters, elapsed_time, snapshot
+                    )
                     self._add_metrics("disk", disk_metrics)
                     self._trigger_callbacks("disk", disk_metrics)
-                    
-                    # Update previous counters
-                    prev_disk_counters = psutil.disk_io_counters(perdisk=True)
                 
                 # Collect network metrics
-                if "network" in self.config.monitoring.metrics:
-                    network_metrics = self._collect_network_metrics(prev_net_counters, elapsed_time)
+                if "network" in enabled_metrics:
+                    # The counters read are kept as the previous ones
+                    network_metrics, prev_net_counters = self._collect_network_metrics(
+                        prev_net_counters, elapsed_time, refresh_slow
+                    )
                     self._add_metrics("network", network_metrics)
                     self._trigger_callbacks("network", network_metrics)
-                    
-                    # Update previous counters
-                    prev_net_counters = psutil.net_io_counters(pernic=True)
                 
                 # Collect system metrics
-                system_metrics = self._collect_system_metrics()
+                system_metrics = self._collect_system_metrics(snapshot)
                 self._add_metrics("system", system_metrics)
                 self._trigger_callbacks("system", system_metrics)
                 
                 # Calculate system status
                 system_status = self._calculate_system_status(system_metrics, None)
+                self._status_cache = (time.monotonic() + self.monitoring_interval, system_status)
                 self._trigger_callbacks("status", system_status)
                 
                 # Update previous time
                 prev_time = current_time
-                
-                # Sleep until next collection
-                time.sleep(self.monitoring_interval)
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}")
-                time.sleep(self.monitoring_interval)
+            
+            # Sleep until next collection; the wait returns True at once
+            # when stopped, which ends the loop
+            if self.stop_monitoring_flag.wait(self.monitoring_interval):
+                break
     
     def _add_metrics(self, metric_type: str, metrics: Dict[str, Any]) -> None:
         """Add metrics to the store.
@@ -443,13 +533,26 @@ class MonitoringOperations:
             metric_type: Metric type (cpu, memory, disk, network, system)
             metrics: Metrics data
         """
-        with self.monitoring_lock:
-            # Add metrics to store
-            self.metrics_store[metric_type].append(metrics)
-            
-            # Trim metrics if necessary
-            if len(self.metrics_store[metric_type]) > self.max_metrics:
-                self.metrics_store[metric_type] = self.metrics_store[metric_type][-self.max_metrics:]
+        # Add metrics to store; the ring buffer drops the oldest when full.
+        # Only the monitoring thread adds metrics, so no lock is taken
+        store = self.metrics_store[metric_type]
+        store.append(metrics)
+        
+        # Publish a copy for the readers
+        self._snapshots[metric_type] = tuple(store)
+    
+    def _recent_metrics(self, metric_type: str, count: int) -> List[Dict[str, Any]]:
+        """Get the most recent metrics of a type, oldest first, without locking.
+        
+        Args:
+            metric_type: Metric type (cpu, memory, disk, network, system)
+            count: Number of metrics to return
+        
+        Returns:
+            List of metrics
+        """
+        snapshot = self._snapshots[metric_type]
+        return list(snapshot[max(0, len(snapshot) - count):])
     
     def _trigger_callbacks(self, event_type: str, data: Dict[str, Any]) -> None:
         """Trigger callbacks for an event.
@@ -458,29 +561,91 @@ class MonitoringOperations:
             event_type: Event type
             data: Event data
         """
-        if event_type in self.callbacks:
-            for callback in self.callbacks[event_type]:
-                try:
-                    callback(data)
-                except Exception as e:
-                    logger.error(f"Error in callback for event {event_type}: {e}")
-    
-    def _collect_cpu_metrics(self) -> Dict[str, Any]:
+        executor = self._callback_executor
+        if executor is None:
+            return
+        
+        for callback in self.callbacks.get(event_type, ()):
+            # Drop the call when too many are pending, so a slow callback
+            # cannot hold up the monitoring loop or pile up work
+            if not self._callback_slots.acquire(blocking=False):
+                logger.debug(f"Dropped callback for event {event_type}: too many pending")
+                continue
+            
+            try:
+                executor.submit(self._run_callback, event_type, callback, data)
+            except RuntimeError:
+                # Executor shut down by stop_monitoring
+                self._callback_slots.release()
+                return
+    
+    def _run_callback(self, event_type: str,
+                      callback: Callable[[Dict[str, Any]], None],
+                      data: Dict[str, Any]) -> None:
+        """Run a callback on a callback worker.
+        
+        Args:
+            event_type: Event type
+            callback: Callback function
+            data: Event data
+        """
+        try:
+            callback(data)
+        except Exception as e:
+            logger.error(f"Error in callback for event {event_type}: {e}")
+        finally:
+            self._callback_slots.release()
+    
+    def _take_snapshot(self, refresh_slow: bool = True) -> Dict[str, Any]:
+        """Take the readings shared by the metric collectors.
+        
+        CPU usage is sampled once per CPU, and the average derived from it,
+        instead of sampling it again for the system metrics.
+        
+        Args:
+            refresh_slow: Whether to recount the processes instead of reusing
+                the previous count
+        
+        Returns:
+            Dictionary with per-CPU and average usage, memory info, load
+            average, partitions and process count
+        """
+        if refresh_slow or self._process_count is None:
+            # A single listing of /proc, without opening any process
+            self._process_count = len(psutil.pids())
+        
+        cpu_usage = self.cpu_ops.get_cpu_usage(per_cpu=True)
+        return {
+            "process_count": self._process_count,
+            "cpu_usage": cpu_usage,
+            "cpu_average": sum(cpu_usage) / len(cpu_usage) if cpu_usage else 0,
+            "memory_info": self.memory_ops.get_memory_info(human=False),
+            "load_average": self.cpu_ops.get_load_average(),
+            "partitions": self.storage_ops.list_partitions()
+        }
+    
+    def _collect_cpu_metrics(self, snapshot: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Collect CPU metrics.
         
+        Args:
+            snapshot: Shared readings of this tick, taken if not given
+        
         Returns:
             Dictionary with CPU metrics
         """
         try:
+            if snapshot is None:
+                snapshot = self._take_snapshot()
+            
             # Get CPU usage
-            cpu_usage = self.cpu_ops.get_cpu_usage(per_cpu=True)
-            cpu_avg = sum(cpu_usage) / len(cpu_usage) if cpu_usage else 0
+            cpu_usage = snapshot["cpu_usage"]
+            cpu_avg = snapshot["cpu_average"]
             
             # Get CPU times
             cpu_times = self.cpu_ops.get_cpu_times(per_cpu=False)
             
             # Get load average
-            load_avg = self.cpu_ops.get_load_average()
+            load_avg = snapshot["load_average"]
             
             # Get CPU stats
             cpu_stats = self.cpu_ops.get_cpu_stats()
@@ -502,18 +667,24 @@ class MonitoringOperations:
             logger.error(f"Error collecting CPU metrics: {e}")
             return {"timestamp": time.time(), "error": str(e)}
     
-    def _collect_memory_metrics(self) -> Dict[str, Any]:
+    def _collect_memory_metrics(self, snapshot: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Collect memory metrics.
         
+        Args:
+            snapshot: Shared readings of this tick, taken if not given
+        
         Returns:
             Dictionary with memory metrics
         """
         try:
             # Get memory info
-            memory_info = self.memory_ops.get_memory_info()
+            if snapshot is not None:
+                memory_info = snapshot["memory_info"]
+            else:
+                memory_info = self.memory_ops.get_memory_info(human=False)
             
             # Get swap info
-            swap_info = self.memory_ops.get_swap_info()
+            swap_info = self.memory_ops.get_swap_info(human=False)
             
             # Create metrics
             metrics = {
@@ -545,33 +716,32 @@ class MonitoringOperations:
     
     def _collect_disk_metrics(self, 
                              prev_counters: Optional[Dict[str, Any]], 
-                             elapsed_time: float) -> Dict[str, Any]:
+                             elapsed_time: float,
+                             snapshot: Optional[Dict[str, Any]] = None
+                             ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
         """Collect disk metrics.
         
         Args:
             prev_counters: Previous disk I/O counters
             elapsed_time: Elapsed time since last collection
+            snapshot: Shared readings of this tick, taken if not given
         
         Returns:
-            Dictionary with disk metrics
+            Tuple of the dictionary with disk metrics and the disk I/O counters
+            read, to pass as prev_counters next time (None on error)
         """
         try:
             # Get disk usage
-            partitions = self.storage_ops.list_partitions()
+            if snapshot is not None:
+                partitions = snapshot["partitions"]
+            else:
+                partitions = self.storage_ops.list_partitions()
             
             # Filter mounted partitions with usage data
-            usage = []
-            for partition in partitions:
-                if "total" in partition and partition["total"] > 0:
-                    usage.append({
-                        "device": partition.get("device", ""),
-                        "mountpoint": partition.get("mountpoint", ""),
-                        "fstype": partition.get("fstype", ""),
-                        "total": partition.get("total", 0),
-                        "used": partition.get("used", 0),
-                        "free": partition.get("free", 0),
-                        "percent": partition.get("percent", 0)
-                    })
+            usage = [
+                dict(zip(_DISK_FIELDS, _disk_proj(p)))
+                for p in partitions if p.get("total", 0) > 0
+            ]
             
             # Get disk I/O counters
             io_counters = psutil.disk_io_counters(perdisk=True)
@@ -579,19 +749,18 @@ class MonitoringOperations:
             # Calculate I/O rates
             io_rates = {}
             if prev_counters and elapsed_time > 0:
+                inv_elapsed = 1.0 / elapsed_time
                 for disk, counters in io_counters.items():
-                    if disk in prev_counters:
-                        prev = prev_counters[disk]
-                        read_bytes_rate = (counters.read_bytes - prev.read_bytes) / elapsed_time
-                        write_bytes_rate = (counters.write_bytes - prev.write_bytes) / elapsed_time
-                        read_count_rate = (counters.read_count - prev.read_count) / elapsed_time
-                        write_count_rate = (counters.write_count - prev.write_count) / elapsed_time
-                        
+                    prev = prev_counters.get(disk)
+                    if prev is not None:
+                        # sdiskio starts with read_count, write_count, read_bytes, write_bytes
+                        read_count, write_count, read_bytes, write_bytes = counters[:4]
+                        prev_read_count, prev_write_count, prev_read_bytes, prev_write_bytes = prev[:4]
                         io_rates[disk] = {
-                            "read_bytes_sec": read_bytes_rate,
-                            "write_bytes_sec": write_bytes_rate,
-                            "read_count_sec": read_count_rate,
-                            "write_count_sec": write_count_rate
+                            "read_bytes_sec": _counter_delta(read_bytes, prev_read_bytes) * inv_elapsed,
+                            "write_bytes_sec": _counter_delta(write_bytes, prev_write_bytes) * inv_elapsed,
+                            "read_count_sec": _counter_delta(read_count, prev_read_count) * inv_elapsed,
+                            "write_count_sec": _counter_delta(write_count, prev_write_count) * inv_elapsed
                         }
             
             # Create metrics
@@ -599,143 +768,143 @@ class MonitoringOperations:
                 "timestamp": time.time(),
                 "usage": usage,
                 "io_counters": {
-                    disk: {
-                        "read_count": counters.read_count,
-                        "write_count": counters.write_count,
-                        "read_bytes": counters.read_bytes,
-                        "write_bytes": counters.write_bytes,
-                        "read_time": counters.read_time,
-                        "write_time": counters.write_time
-                    }
+                    disk: dict(zip(_DISK_IO_FIELDS, counters))
                     for disk, counters in io_counters.items()
                 },
                 "io_rates": io_rates
             }
             
-            return metrics
+            return metrics, io_counters
         except Exception as e:
             logger.error(f"Error collecting disk metrics: {e}")
-            return {"timestamp": time.time(), "error": str(e)}
+            return {"timestamp": time.time(), "error": str(e)}, None
     
     def _collect_network_metrics(self, 
                                prev_counters: Optional[Dict[str, Any]], 
-                               elapsed_time: float) -> Dict[str, Any]:
+                               elapsed_time: float,
+                               refresh_connections: bool = True
+                               ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
         """Collect network metrics.
         
         Args:
             prev_counters: Previous network I/O counters
             elapsed_time: Elapsed time since last collection
+            refresh_connections: Whether to recount the connections instead of
+                reusing the previous counts
         
         Returns:
-            Dictionary with network metrics
+            Tuple of the dictionary with network metrics and the network I/O
+            counters read, to pass as prev_counters next time (None on error)
         """
         try:
             # Get network I/O counters
             io_counters = psutil.net_io_counters(pernic=True)
             
-            # Get network connections
-            connections = psutil.net_connections()
-            
-            # Count connection types
-            connection_counts = {
-                "tcp": 0,
-                "udp": 0,
-                "unix": 0,
-                "other": 0,
-                "established": 0,
-                "listening": 0,
-                "total": len(connections)
-            }
-            
-            for conn in connections:
-                # Count by protocol
-                if conn.type == socket.SOCK_STREAM:
-                    connection_counts["tcp"] += 1
-                elif conn.type == socket.SOCK_DGRAM:
-                    connection_counts["udp"] += 1
-                elif conn.family == socket.AF_UNIX:
-                    connection_counts["unix"] += 1
-                else:
-                    connection_counts["other"] += 1
-                
-                # Count by status
-                if conn.status == "ESTABLISHED":
-                    connection_counts["established"] += 1
-                elif conn.status == "LISTEN":
-                    connection_counts["listening"] += 1
+            # Count connection types and statuses
+            if refresh_connections or self._connection_counts is None:
+                self._connection_counts = self._count_connections()
+            connection_counts = dict(self._connection_counts)
             
             # Calculate network rates
             net_rates = {}
             if prev_counters and elapsed_time > 0:
+                inv_elapsed = 1.0 / elapsed_time
                 for nic, counters in io_counters.items():
-                    if nic in prev_counters:
-                        prev = prev_counters[nic]
-                        bytes_sent_rate = (counters.bytes_sent - prev.bytes_sent) / elapsed_time
-                        bytes_recv_rate = (counters.bytes_recv - prev.bytes_recv) / elapsed_time
-                        packets_sent_rate = (counters.packets_sent - prev.packets_sent) / elapsed_time
-                        packets_recv_rate = (counters.packets_recv - prev.packets_recv) / elapsed_time
-                        
+                    prev = prev_counters.get(nic)
+                    if prev is not None:
+                        # snetio starts with bytes_sent, bytes_recv, packets_sent, packets_recv
+                        bytes_sent, bytes_recv, packets_sent, packets_recv = counters[:4]
+                        prev_bytes_sent, prev_bytes_recv, prev_packets_sent, prev_packets_recv = prev[:4]
                         net_rates[nic] = {
-                            "bytes_sent_sec": bytes_sent_rate,
-                            "bytes_recv_sec": bytes_recv_rate,
-                            "packets_sent_sec": packets_sent_rate,
-                            "packets_recv_sec": packets_recv_rate
+                            "bytes_sent_sec": _counter_delta(bytes_sent, prev_bytes_sent) * inv_elapsed,
+                            "bytes_recv_sec": _counter_delta(bytes_recv, prev_bytes_recv) * inv_elapsed,
+                            "packets_sent_sec": _counter_delta(packets_sent, prev_packets_sent) * inv_elapsed,
+                            "packets_recv_sec": _counter_delta(packets_recv, prev_packets_recv) * inv_elapsed
                         }
             
             # Create metrics
             metrics = {
                 "timestamp": time.time(),
                 "io_counters": {
-                    nic: {
-                        "bytes_sent": counters.bytes_sent,
-                        "bytes_recv": counters.bytes_recv,
-                        "packets_sent": counters.packets_sent,
-                        "packets_recv": counters.packets_recv,
-                        "errin": counters.errin,
-                        "errout": counters.errout,
-                        "dropin": counters.dropin,
-                        "dropout": counters.dropout
-                    }
+                    nic: counters._asdict()
                     for nic, counters in io_counters.items()
                 },
                 "io_rates": net_rates,
                 "connections": connection_counts
             }
             
-            return metrics
+            return metrics, io_counters
         except Exception as e:
             logger.error(f"Error collecting network metrics: {e}")
-            return {"timestamp": time.time(), "error": str(e)}
+            return {"timestamp": time.time(), "error": str(e)}, None
+    
+    def _count_connections(self) -> Dict[str, int]:
+        """Count the network connections by type and status.
+        
+        Returns:
+            Dictionary with connection counts
+        """
+        connections = psutil.net_connections(kind="inet")
+        
+        # Count in C through positional field access, then fold the few
+        # distinct (family, type) pairs
+        kinds = Counter(map(_conn_family_type, connections))
+        statuses = Counter(map(_conn_status, connections))
+        
+        sock_stream = socket.SOCK_STREAM
+        sock_dgram = socket.SOCK_DGRAM
+        tcp = udp = unix = other = 0
+        for (family, sock_type), count in kinds.items():
+            if sock_type == sock_stream:
+                tcp += count
+            elif sock_type == sock_dgram:
+                udp += count
+            elif family == socket.AF_UNIX:
+                unix += count
+            else:
+                other += count
+        
+        return {
+            "tcp": tcp,
+            "udp": udp,
+            "unix": unix,
+            "other": other,
+            "established": statuses["ESTABLISHED"],
+            "listening": statuses["LISTEN"],
+            "total": len(connections)
+        }
     
-    def _collect_system_metrics(self) -> Dict[str, Any]:
+    def _collect_system_metrics(self, snapshot: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Collect system metrics.
         
+        Args:
+            snapshot: Shared readings of this tick, taken if not given
+        
         Returns:
             Dictionary with system metrics
         """
         try:
+            if snapshot is None:
+                snapshot = self._take_snapshot()
+            
             # Get CPU usage
-            cpu_usage = self.cpu_ops.get_cpu_usage(per_cpu=False)
+            cpu_usage = snapshot["cpu_average"]
             
             # Get memory info
-            memory_info = self.memory_ops.get_memory_info()
+            memory_info = snapshot["memory_info"]
             
             # Get load average
-            load_avg = self.cpu_ops.get_load_average()
+            load_avg = snapshot["load_average"]
             
             # Get disk usage
-            partitions = self.storage_ops.list_partitions()
-            mounted_partitions = [p for p in partitions if "total" in p and p["total"] > 0]
+            partitions = snapshot["partitions"]
             disk_usage = [
-                {
-                    "mountpoint": p.get("mountpoint", ""),
-                    "percent": p.get("percent", 0)
-                }
-                for p in mounted_partitions
+                dict(zip(("mountpoint", "percent"), _disk_usage_proj(p)))
+                for p in partitions if p.get("total", 0) > 0
             ]
             
             # Get process count
-            process_count = len(self.process_ops.list_processes(include_threads=False, include_username=False))
+            process_count = snapshot["process_count"]
             
             # Get boot time
             boot_time = psutil.boot_time()
@@ -24,14 +24,15 @@ logger = logging.getLogger(__name__)
 class LogResources:
     """Manager for log resources as MCP resources."""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, log_ops: Optional[LogOperations] = None):
         """Initialize log resources.
         
         Args:
             config: Server configuration
+            log_ops: Log operations instance to share; if None, creates one
         """
         self.config = config
-        self.log_ops = LogOperations(config)
+        self.log_ops = log_ops if log_ops is not None else LogOperations(config)
     
     def register_resources(self, mcp: FastMCP) -> None:
         """Register all log resource templates and static resources."""
@@ -313,15 +314,17 @@ class LogResources:
                 return json.dumps({"error": str(e)})
 
 
-def register_log_resources(mcp: FastMCP, config: Config) -> None:
+def register_log_resources(mcp: FastMCP, config: Config,
+                           log_ops: Optional[LogOperations] = None) -> None:
     """Register log resources with the MCP server.
     
     Args:
         mcp: MCP server.
         config: Server configuration.
+        log_ops: Log operations instance to share. If None, creates one.
     """
     # Create the resources manager
-    resources = LogResources(config)
+    resources = LogResources(config, log_ops)
     
     # Register the resources
     resources.register_resources(mcp)
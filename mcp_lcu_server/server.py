@@ -10,6 +10,7 @@
 # LICENSE file in the root directory of this source tree.
 
 import asyncio
+import atexit
 import logging
 import sys
 import threading
@@ -23,6 +24,7 @@ from mcp_lcu_server.linux.cpu import CPUOperations
 from mcp_lcu_server.linux.memory import MemoryOperations
 from mcp_lcu_server.linux.process import ProcessOperations
 from mcp_lcu_server.linux.command import CommandOperations
+from mcp_lcu_server.linux.logs import LogOperations
 # Import tool registration functions
 from mcp_lcu_server.tools.cpu_tools import register_cpu_tools
 from mcp_lcu_server.tools.memory_tools import register_memory_tools
@@ -69,6 +71,11 @@ def create_server(config: Optional[Config] = None) -> FastMCP:
         }  
     )
     
+    # Log operations shared by the log tools and resources, so that at most
+    # one journal follower runs; it is stopped when the process exits
+    log_ops = LogOperations(config)
+    atexit.register(log_ops.close)
+    
     # Register tools - monitor calls during registration to debug
     try:
         logger.debug("Registering CPU tools")
@@ -132,7 +139,7 @@ def create_server(config: Optional[Config] = None) -> FastMCP:
     
     try:
         logger.debug("Registering log tools")
-        register_log_tools(mcp, config)
+        register_log_tools(mcp, config, log_ops)
     except Exception as e:
         logger.error(f"Error registering log tools: {e}")
     
@@ -144,7 +151,7 @@ def create_server(config: Optional[Config] = None) -> FastMCP:
     register_monitoring_resources(mcp, config)
     register_filesystem_resources(mcp, config)
     register_network_resources(mcp, config)
-    register_log_resources(mcp, config)
+    register_log_resources(mcp, config, log_ops)
     
     return mcp
 
@@ -26,8 +26,8 @@ def register_hardware_tools(mcp: FastMCP) -> None:
     Args:
         mcp: MCP server.
     """
-    # Create hardware operations instance
-    hw_ops = HardwareOperations()
+    # Get shared hardware operations instance
+    hw_ops = HardwareOperations.get()
     
     @mcp.tool()
     def hardware_get_system_info() -> str:
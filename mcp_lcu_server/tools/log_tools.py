@@ -21,15 +21,18 @@ from mcp_lcu_server.config import Config
 logger = logging.getLogger(__name__)
 
 
-def register_log_tools(mcp: FastMCP, config: Config) -> None:
+def register_log_tools(mcp: FastMCP, config: Config,
+                       log_ops: Optional[LogOperations] = None) -> None:
     """Register log tools with the MCP server.
     
     Args:
         mcp: MCP server.
         config: Server configuration.
+        log_ops: Log operations instance to share. If None, creates one.
     """
     # Create log operations instance
-    log_ops = LogOperations(config)
+    if log_ops is None:
+        log_ops = LogOperations(config)
     
     @mcp.tool()
     def log_list_available_logs() -> str:
@@ -59,7 +62,8 @@ def register_log_tools(mcp: FastMCP, config: Config) -> None:
                            since: Optional[str] = None, 
                            until: Optional[str] = None,
                            unit: Optional[str] = None,
-                           priority: Optional[str] = None) -> str:
+                           priority: Optional[str] = None,
+                           raw: bool = False) -> str:
         """Get logs from the systemd journal.
         
         This function retrieves logs from the systemd journal with various
@@ -71,14 +75,15 @@ def register_log_tools(mcp: FastMCP, config: Config) -> None:
             until: Time to end at
             unit: Filter by systemd unit
             priority: Filter by priority (0-7, emerg to debug)
+            raw: Lightweight mode returning plain text lines instead of full journal entries
         
         Returns:
             JSON string with journal log entries
         """
-        logger.info(f"Getting journal logs (count={count}, since={since}, unit={unit}, priority={priority})")
+        logger.info(f"Getting journal logs (count={count}, since={since}, unit={unit}, priority={priority}, raw={raw})")
         
         try:
-            logs = log_ops.get_journal_logs(count, since, until, unit, priority)
+            logs = log_ops.get_journal_logs(count, since, until, unit, priority, raw=raw)
             return json.dumps(logs, indent=2)
         except Exception as e:
             logger.error(f"Error getting journal logs: {e}")
@@ -188,21 +193,22 @@ def register_log_tools(mcp: FastMCP, config: Config) -> None:
             return json.dumps({"error": str(e)})
     
     @mcp.tool()
-    def log_get_boot_logs(count: int = 1) -> str:
+    def log_get_boot_logs(count: int = 1, raw: bool = False) -> str:
         """Get boot logs.
         
         This function retrieves logs related to system boot.
         
         Args:
             count: Number of boot sessions to return (1 for current boot)
+            raw: Lightweight mode returning plain text lines instead of full journal entries
         
         Returns:
             JSON string with boot log entries
         """
-        logger.info(f"Getting boot logs (count={count})")
+        logger.info(f"Getting boot logs (count={count}, raw={raw})")
         
         try:
-            logs = log_ops.get_boot_logs(count)
+            logs = log_ops.get_boot_logs(count, raw=raw)
             return json.dumps(logs, indent=2)
         except Exception as e:
             logger.error(f"Error getting boot logs: {e}")